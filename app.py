@@ -1,18 +1,73 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Blueprint, Flask, current_app, render_template, request, jsonify
 from flask_cors import CORS  # You'll need to install this: pip install flask-cors
-import pandas as pd
-from io import BytesIO
+import asyncio
 import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import csv
+import hashlib
+import heapq
+import importlib
+import importlib.util
+import itertools
+import os
+import shutil
+import signal
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import uuid
+import zlib
+import collections
+from collections import OrderedDict
 import functools
 import time
 import random
 import logging
-import requests
-from bs4 import BeautifulSoup
+import httpx  # Async HTTP client for the fetch engine: pip install httpx
 import re
 from urllib.parse import quote_plus, parse_qs, urlparse
-import backoff
 import json
+from email.utils import parsedate_to_datetime
+
+
+class LazyModule:
+    """Stand-in for a heavy module that imports it on first attribute access
+
+    Keeps pandas, the HTML parsers and the spreadsheet libraries out of
+    process start-up, and off requests that never touch them - see
+    benchmarks/import_budget.py.
+    """
+
+    def __init__(self, name):
+        self.__name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name)
+        # Later lookups are plain attribute hits, which matters in numpy-heavy loops
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+def module_available(name):
+    """Whether a module can be imported, checked without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+bs4 = LazyModule('bs4')
+openpyxl = LazyModule('openpyxl')
+xlsxwriter = LazyModule('xlsxwriter')
+selectolax_lexbor = LazyModule('selectolax.lexbor')  # Optional fast parser: pip install selectolax
+SELECTOLAX_AVAILABLE = module_available('selectolax.lexbor')
+PARQUET_AVAILABLE = module_available('pyarrow')  # Optional, lets evicted results spill to Parquet: pip install pyarrow
+HTTP2_AVAILABLE = module_available('h2')  # Optional, enables HTTP/2 on the shared connection pool: pip install httpx[http2]
+BS4_PARSER = 'lxml' if module_available('lxml') else 'html.parser'  # Optional, speeds up BeautifulSoup: pip install lxml
 
 
 
@@ -20,17 +75,134 @@ import json
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+# Origins allowed to call the API, comma-separated - see create_app()
+CORS_ORIGINS = os.environ.get('CORS_ORIGINS', 'http://localhost:3000,http://192.168.27.96:3000').split(',')
 
-# Enable CORS for all routes - adjust origin if needed
-CORS(app, resources={r"/*": {"origins": ["http://localhost:3000", "http://192.168.27.96:3000"]}})
+# Download result store settings - see ResultStore
+RESULT_STORE_MAX_ENTRIES = 50  # Result sets kept in memory
+RESULT_STORE_MAX_ROWS = 500000  # Publication rows kept in memory across all result sets
+RESULT_SPILL_DIR = os.environ.get('RESULT_SPILL_DIR', 'results')  # Evicted result sets go here as Parquet
+RESULT_SPILL_TTL = 24 * 3600  # Spilled result sets older than this are deleted
 
-# Global variable to store processed data
-processed_data = None
+# Scholar site to scrape - point at a local stand-in (see benchmarks/) to test without the live site
+SCHOLAR_BASE_URL = os.environ.get('SCHOLAR_BASE_URL', 'https://scholar.google.com').rstrip('/')
 
-# Simple cache to avoid duplicate searches
-faculty_cache = {}
+# Result cache settings - see create_cache_backend()
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'sqlite')  # 'sqlite' or 'memory'
+CACHE_PATH = os.environ.get('CACHE_PATH', 'faculty_cache.sqlite3')
+CACHE_MAX_ENTRIES = 5000  # Least recently used entries are evicted beyond this
 CACHE_TIMEOUT = 3600  # Cache timeout in seconds (1 hour)
+PROFILE_STALE_TTL = 7 * 24 * 3600  # Expired profiles are still served, and refreshed in the background, this long
+
+# Raw page cache under fetch_url_async() - see fetch_url_async() and run_parser()
+PAGE_CACHE_PATH = os.environ.get('PAGE_CACHE_PATH', 'page_cache.sqlite3')
+PAGE_CACHE_MAX_ENTRIES = int(os.environ.get('PAGE_CACHE_MAX_ENTRIES', '5000'))  # Pages and memoized parses kept
+PAGE_CACHE_TTL = 7 * 24 * 3600  # How long a page is kept for revalidation and its parse for reuse
+PARSER_VERSION = 1  # Bump when a parser's output changes, so memoized parses are not reused
+
+# Author-id resolution index - see lookup_author_index_async()
+AUTHOR_INDEX_TTL = 90 * 24 * 3600  # How long a resolved name/institution -> author id mapping is kept
+AUTHOR_INDEX_MIN_CONFIDENCE = 0.3  # Matches below this institution score are re-verified...
+AUTHOR_INDEX_REVERIFY_AGE = 7 * 24 * 3600  # ...once they are this old
+
+# Incremental publication refresh
+PUBLICATION_HISTORY_TTL = 30 * 24 * 3600  # How long last-seen publication lists are kept
+FULL_REFRESH_INTERVAL = 7 * 24 * 3600  # Walk every page again at least this often
+INCREMENTAL_KNOWN_RUN = 10  # Known titles in a row at the end of a page that stop paging
+PUBLICATION_PROGRESS_TTL = 7 * 24 * 3600  # How long a partly fetched publication walk is kept for resuming
+PUBLICATIONS_PAGE_SIZE = 100  # Maximum page size Google Scholar allows
+AUTHOR_DOWNLOAD_RETRY_AFTER = 5  # Seconds a client waits before asking again for an author download still being fetched
+
+# Publication columns - see publications_frame()
+PUBLICATION_FIELDS = ('Title', 'Authors', 'Venue', 'Year')  # Columns extracted from a publications page
+PUBLICATION_COLUMNS = ['Title', 'Year', 'Type', 'Venue', 'Authors']  # Column order of publication DataFrames
+PUBLICATION_TYPES = ['Journal', 'Conference', 'Other']  # Categories of the Type column - see publication_types()
+JOURNAL_VENUE_PATTERN = r'journal|transactions'
+CONFERENCE_VENUE_PATTERN = r'conference|proceedings|symposium'
+
+# Cross-faculty publication matching - see PublicationIndex
+MINHASH_PERMUTATIONS = 64  # MinHash signature length per distinct title
+MINHASH_BANDS = 16  # LSH bands; titles colliding in any band are compared
+MINHASH_BATCH_TITLES = 2000  # Titles whose signatures are computed in one array operation
+TITLE_SHINGLE_SIZE = 4  # Bytes per title shingle, at most 8
+TITLE_SIMILARITY_THRESHOLD = 0.8  # Shingle Jaccard similarity at which two titles are the same work
+SHORT_TITLE_WORDS = 3  # Titles this short only match within the same year
+AUTHOR_OVERLAP_THRESHOLD = 0.5  # Share of the shorter author list's surnames two rows must have in common
+
+# Job analytics - see faculty_aggregates()
+ANALYTICS_TOP_VENUES = 10  # Venues listed per faculty and for the whole job
+PLACEHOLDER_VENUES = ('', 'N/A')  # What the parsers record for a missing venue; left out of analytics
+
+# Fetch engine limits
+MAX_CONCURRENT_REQUESTS = 8  # Global budget of requests in flight at once
+MAX_CONCURRENT_FACULTY = 10  # Faculty processed at once during bulk uploads
+
+# Shared HTTP connection pool - see get_http_client()
+HTTP_POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', MAX_CONCURRENT_REQUESTS))  # Open connections at most
+HTTP_KEEPALIVE_CONNECTIONS = int(os.environ.get('HTTP_KEEPALIVE_CONNECTIONS', HTTP_POOL_SIZE))  # Idle connections kept open
+HTTP_KEEPALIVE_EXPIRY = 60  # Seconds an idle connection is kept before closing
+HTTP_TIMEOUT = 15  # Seconds per request
+
+# Background upload jobs
+MAX_CONCURRENT_JOBS = 2  # Uploads processed at once; later uploads wait their turn
+MAX_JOBS = 100  # Finished jobs kept for polling; the oldest are dropped beyond this
+JOB_STREAM_HEARTBEAT = 15  # Seconds between progress events on an idle stream
+JOBS_PATH = os.environ.get('JOBS_PATH', 'jobs.sqlite3')  # Job checkpoints - see JobStore; ':memory:' keeps them in-process
+
+# Scaling out - see run_worker(). 'inline' runs jobs on the fetch engine of the API process that
+# accepted them; 'queue' leaves them in JOBS_PATH for `python app.py worker` processes to claim
+JOB_RUNNER = os.environ.get('JOB_RUNNER', 'inline')
+JOB_LEASE_SECONDS = 900  # A claimed faculty whose lease isn't renewed within this long is handed to another worker
+JOB_LEASE_RENEW_INTERVAL = 60  # Seconds between lease renewals for a worker's in-flight faculty
+JOB_REFRESH_INTERVAL = 1.0  # Seconds between reloads of a queued job's progress in the API process
+WORKER_POLL_INTERVAL = 1.0  # Seconds an idle worker waits before checking the queue again
+# SQLite file holding the request budget shared by all processes on a host - see SharedRateBudget.
+# Empty keeps the budget per process.
+RATE_BUDGET_PATH = os.environ.get('RATE_BUDGET_PATH', JOBS_PATH if JOB_RUNNER == 'queue' else '')
+
+# Roster uploads - see RosterReader
+ROSTER_CHUNK_SIZE = 50  # Faculty handed to a job at a time while its roster is still being read
+ROSTER_MAX_PENDING = 500  # Faculty scheduled but unfinished before reading the roster pauses
+ROSTER_FEED_CHECK_INTERVAL = 1.0  # Seconds between checks that a job waiting for its next chunk hasn't stopped
+ROSTER_LEASE_SECONDS = 120  # A queued job's open roster whose reader hasn't checked in within this long is closed
+ROSTER_LEASE_RENEW_INTERVAL = 30  # Seconds between a roster reader's check-ins
+ROSTER_MAX_NAME_LENGTH = 200  # Longer names are rejected as malformed rows
+ROSTER_MAX_INVALID_REPORTED = 100  # Invalid rows listed in job progress; the rest are only counted
+
+# Export
+EXPORT_CHUNK_ROWS = 5000  # Rows serialized at a time when streaming downloads
+
+# HTML parse workers - 0 parses inline on the fetch engine's event loop
+PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', '0'))
+
+# Metrics - see Metrics and /metrics
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)  # Timing histogram bounds in seconds
+# Level for logs emitted once per candidate, faculty row or page; set ROW_LOG_LEVEL=DEBUG to quiet them under load
+ROW_LOG_LEVEL = getattr(logging, os.environ.get('ROW_LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
+# Request scheduler budget (applies per host)
+SCHEDULER_RATE = float(os.environ.get('SCHEDULER_RATE', '0.5'))  # Requests per second
+SCHEDULER_BURST = int(os.environ.get('SCHEDULER_BURST', '3'))  # Requests allowed back-to-back after an idle period
+
+# Retry policy for outbound requests - see RetryPolicy
+RETRY_MAX_ATTEMPTS = 4  # Tries per request, including the first
+RETRY_BASE_DELAY = 1.0  # Seconds before the first retry; doubles on each further retry, plus jitter
+RETRY_MAX_DELAY = 60  # Cap on computed backoff waits; a server's Retry-After is honoured in full, for the whole host
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Circuit breaker shared by all requests - see CircuitBreaker
+BREAKER_WINDOW = 20  # Recent request outcomes considered
+BREAKER_ERROR_RATIO = 0.5  # Share of failures in the window that trips the breaker
+BREAKER_SLOWDOWN = 4  # The scheduler's rate is divided by this while the breaker is open
+BREAKER_COOLDOWN = 30  # Seconds the breaker stays open before the full rate is tried again
+
+# Request priority classes - lower values are served first
+PRIORITY_INTERACTIVE = 0  # Single searches from the UI
+PRIORITY_BULK = 1  # Excel uploads
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: 'interactive', PRIORITY_BULK: 'bulk'}
+
+# Priority of requests issued by the current task; bulk processing overrides it
+request_priority = contextvars.ContextVar('request_priority', default=PRIORITY_INTERACTIVE)
 
 # User agent rotation list
 USER_AGENTS = [
@@ -41,134 +213,1029 @@ USER_AGENTS = [
     "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
 ]
 
+# Metrics
+class Metrics:
+    """Thread-safe counters and timing histograms, rendered in the Prometheus text format
+
+    Metric names are given without the "pubsumgen_" prefix; labels are passed
+    as keyword arguments.
+    """
+
+    PREFIX = 'pubsumgen_'
+    HELP = {
+        'fetch_requests_total': 'Outbound HTTP requests by response status',
+        'fetch_scheduler_wait_seconds': 'Time requests spent waiting for a request scheduler token',
+        'fetch_semaphore_wait_seconds': 'Time requests spent waiting for a slot in the global request budget',
+        'fetch_network_seconds': 'Time spent on the network per request',
+        'retries_total': 'Request retries by failure reason',
+        'scheduler_pauses_total': 'Hosts paused by the scheduler for a server-sent Retry-After',
+        'retry_sleep_seconds': 'Time spent sleeping before request retries',
+        'breaker_trips_total': 'Times the circuit breaker opened and slowed the request scheduler',
+        'parse_seconds': 'HTML parse time by parse function',
+        'dataframe_seconds': 'DataFrame build and sort time by stage',
+        'export_seconds': 'Time to produce a download by format',
+        'export_rows_total': 'Rows exported by format',
+        'cache_requests_total': 'Result cache lookups by key kind and result',
+        'page_fetches_total': 'Fetched pages by result against the raw page cache (new, changed, unchanged, not_modified)',
+        'profile_refreshes_total': 'Background refreshes of stale profiles by outcome',
+        'faculty_processed_total': 'Faculty processed by outcome',
+    }
+
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> value
+        self._timings = {}  # (name, labels) -> [per-bucket counts..., count, sum]
+
+    @staticmethod
+    def _key(name, labels):
+        # Label values are strings in the output; normalising them here also keeps keys sortable
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    def inc(self, name, amount=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    timing[i] += 1
+            timing[-2] += 1
+            timing[-1] += seconds
+
+    @contextlib.contextmanager
+    def span(self, name, **labels):
+        """Time the enclosed block into the named histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed_iter(self, chunks, name, **labels):
+        """Pass through a streamed response body, timing it from first to last chunk"""
+        with self.span(name, **labels):
+            yield from chunks
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format
+
+        A label may be given values of different types, e.g. a status code or
+        "error":
+
+        >>> registry = Metrics()
+        >>> registry.inc('fetch_requests_total', status='error')
+        >>> registry.inc('fetch_requests_total', status=200)
+        >>> print(registry.render(), end='')
+        # HELP pubsumgen_fetch_requests_total Outbound HTTP requests by response status
+        # TYPE pubsumgen_fetch_requests_total counter
+        pubsumgen_fetch_requests_total{status="200"} 1
+        pubsumgen_fetch_requests_total{status="error"} 1
+        """
+        def format_labels(labels, extra=()):
+            pairs = [f'{label}="{str(value)}"' for label, value in list(labels) + list(extra)]
+            return '{' + ','.join(pairs) + '}' if pairs else ''
+        
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timings = sorted((key, list(timing)) for key, timing in self._timings.items())
+        
+        lines = []
+        seen = set()
+        for (name, labels), value in counters:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {self.PREFIX}{name} {self.HELP.get(name, name)}")
+                lines.append(f"# TYPE {self.PREFIX}{name} counter")
+            lines.append(f"{self.PREFIX}{name}{format_labels(labels)} {value}")
+        for (name, labels), timing in timings:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {self.PREFIX}{name} {self.HELP.get(name, name)}")
+                lines.append(f"# TYPE {self.PREFIX}{name} histogram")
+            for bound, count in zip(self.buckets, timing):
+                lines.append(f"{self.PREFIX}{name}_bucket{format_labels(labels, [('le', bound)])} {count}")
+            lines.append(f"{self.PREFIX}{name}_bucket{format_labels(labels, [('le', '+Inf')])} {timing[-2]}")
+            lines.append(f"{self.PREFIX}{name}_count{format_labels(labels)} {timing[-2]}")
+            lines.append(f"{self.PREFIX}{name}_sum{format_labels(labels)} {timing[-1]:.6f}")
+        return '\n'.join(lines) + '\n'
+
+# Shared metrics for the whole process
+metrics = Metrics()
+
+# Async fetch engine
+# All scraping runs as coroutines on a single background event loop. Sync callers
+# (Flask request threads) hand work to it with run_async().
+_engine_loop = None
+_engine_lock = threading.Lock()
+_request_semaphore = None
+_http_client = None
+_parse_pool = None
+_inflight = {}  # single-flight key -> future shared by concurrent callers
+
+def get_engine_loop():
+    """Start the fetch engine's event loop thread on first use and return the loop"""
+    global _engine_loop
+    with _engine_lock:
+        if _engine_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="fetch-engine", daemon=True)
+            thread.start()
+            _engine_loop = loop
+    return _engine_loop
+
+def run_async(coro):
+    """Run a coroutine on the fetch engine and block until it completes"""
+    loop = get_engine_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("run_async() cannot be called from inside the fetch engine; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+async def single_flight(key, coro_factory):
+    """Run coro_factory() at most once at a time per key; concurrent callers await the same result"""
+    future = _inflight.get(key)
+    if future is not None:
+        logger.info(f"Joining in-flight request for {key}")
+        # Shield so a cancelled waiter doesn't cancel the shared work
+        return await asyncio.shield(future)
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await coro_factory()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so a flight without waiters doesn't warn
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+def get_request_semaphore():
+    """Semaphore enforcing MAX_CONCURRENT_REQUESTS across the whole engine"""
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _request_semaphore
+
+def get_parse_pool():
+    """Process pool for CPU-bound HTML parsing, created on first use"""
+    global _parse_pool
+    with _engine_lock:
+        if _parse_pool is None:
+            _parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return _parse_pool
+
+async def run_parser(func, html, *args):
+    """Run a parse function on the parse-worker pool, or inline when PARSE_WORKERS is 0
+
+    func must be a module-level function taking raw HTML and returning plain
+    dicts/lists/tuples so that arguments and results pickle cheaply. Results
+    are memoized by the page's content hash (and the other arguments), so a
+    page that has not changed since it was last parsed is not parsed again.
+    Memoized results come back from the SQLite page cache with lists for tuples.
+    """
+    loop = asyncio.get_running_loop()
+    memo_key = f"parsed:{PARSER_VERSION}:{func.__name__}:{content_hash(html)}"
+    if args:
+        memo_key += ':' + content_hash(json.dumps(args, sort_keys=True, default=str).encode('utf-8'))
+    # Cache calls go to the default executor so SQLite I/O never blocks the fetch engine
+    memoized = await loop.run_in_executor(None, page_cache.get, memo_key)
+    if memoized is not None:
+        return copy.deepcopy(memoized['result'])  # The memory backend hands out the stored object
+    
+    with metrics.span('parse_seconds', parser=func.__name__):
+        if PARSE_WORKERS <= 0:
+            result = func(html, *args)
+        else:
+            result = await loop.run_in_executor(get_parse_pool(), func, html, *args)
+    await loop.run_in_executor(None, page_cache.set, memo_key, {'result': copy.deepcopy(result)}, PAGE_CACHE_TTL)
+    return result
+
+class RequestScheduler:
+    """Token-bucket scheduler that every outbound request passes through.
+
+    Each host has a bucket refilled at `rate` tokens per second, holding at most
+    `burst` tokens. Waiting requests are granted tokens by priority class, then
+    in arrival order. With a shared_budget, each granted request also reserves
+    a slot in the budget shared with other processes before it is sent. A host
+    can be paused (e.g. for a Retry-After), holding all its requests until
+    then. Must be used from the fetch engine's event loop.
+    """
+
+    def __init__(self, rate=SCHEDULER_RATE, burst=SCHEDULER_BURST, shared_budget=None):
+        self.rate = rate
+        self.burst = burst
+        self.shared_budget = shared_budget
+        self.throttle = 1  # Divides rate; raised by the circuit breaker while errors are high
+        self._buckets = {}  # host -> [tokens, last refill time]
+        self._queues = {}  # host -> heap of (priority, sequence, future)
+        self._timers = {}  # host -> pending dispatch timer
+        self._paused_until = {}  # host -> monotonic time before which no tokens are granted
+        self._sequence = itertools.count()
+        self._granted = {priority: 0 for priority in PRIORITY_NAMES}
+        self._wait_total = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self._wait_max = {priority: 0.0 for priority in PRIORITY_NAMES}
+
+    async def acquire(self, host, priority=None):
+        """Wait until a request to host is allowed under the budget"""
+        if priority is None:
+            priority = request_priority.get()
+        future = asyncio.get_running_loop().create_future()
+        queued_at = time.monotonic()
+        heapq.heappush(self._queues.setdefault(host, []), (priority, next(self._sequence), future))
+        self._dispatch(host)
+        
+        # A cancelled waiter stays in the heap and is skipped by _dispatch
+        await future
+        
+        if self.shared_budget is not None:
+            delay = await asyncio.get_running_loop().run_in_executor(
+                None, self.shared_budget.reserve, host, self.rate / self.throttle, self.burst
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+        
+        waited = time.monotonic() - queued_at
+        self._granted[priority] = self._granted.get(priority, 0) + 1
+        self._wait_total[priority] = self._wait_total.get(priority, 0.0) + waited
+        self._wait_max[priority] = max(self._wait_max.get(priority, 0.0), waited)
+        return waited
+
+    async def pause(self, host, seconds):
+        """Grant no requests to host for the next `seconds`, in every process sharing the budget"""
+        until = time.monotonic() + seconds
+        if until <= self._paused_until.get(host, 0.0):
+            return
+        logger.warning(f"Pausing requests to {host} for {seconds:.1f}s")
+        self._paused_until[host] = until
+        metrics.inc('scheduler_pauses_total')
+        if self.shared_budget is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.shared_budget.pause, host, seconds, self.rate / self.throttle, self.burst
+            )
+
+    def _refill(self, host):
+        now = time.monotonic()
+        bucket = self._buckets.setdefault(host, [float(self.burst), now])
+        bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate / self.throttle)
+        bucket[1] = now
+        return bucket
+
+    def _dispatch(self, host):
+        """Hand out available tokens to queued requests, then schedule the next refill"""
+        queue = self._queues.get(host)
+        if not queue:
+            return
+        paused_for = self._paused_until.get(host, 0.0) - time.monotonic()
+        if paused_for > 0:
+            timer = self._timers.pop(host, None)
+            if timer is not None:
+                timer.cancel()
+            self._timers[host] = asyncio.get_running_loop().call_later(paused_for, self._on_timer, host)
+            return
+        self._paused_until.pop(host, None)
+        bucket = self._refill(host)
+        
+        while queue:
+            future = queue[0][2]
+            if future.done():
+                heapq.heappop(queue)
+                continue
+            if bucket[0] < 1:
+                break
+            bucket[0] -= 1
+            heapq.heappop(queue)
+            future.set_result(None)
+        
+        if queue and host not in self._timers:
+            delay = (1 - bucket[0]) * self.throttle / self.rate
+            self._timers[host] = asyncio.get_running_loop().call_later(delay, self._on_timer, host)
+
+    def _on_timer(self, host):
+        self._timers.pop(host, None)
+        self._dispatch(host)
+
+    def stats(self):
+        """Snapshot of queue depth and wait-time metrics per priority class"""
+        queue_depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for queue in list(self._queues.values()):
+            for priority, _, future in list(queue):
+                if not future.done():
+                    name = PRIORITY_NAMES.get(priority, str(priority))
+                    queue_depth[name] = queue_depth.get(name, 0) + 1
+        
+        priorities = {}
+        for priority, granted in list(self._granted.items()):
+            wait_total = self._wait_total.get(priority, 0.0)
+            priorities[PRIORITY_NAMES.get(priority, str(priority))] = {
+                'requests': granted,
+                'wait_seconds_total': round(wait_total, 3),
+                'wait_seconds_avg': round(wait_total / granted, 3) if granted else 0.0,
+                'wait_seconds_max': round(self._wait_max.get(priority, 0.0), 3)
+            }
+        
+        return {
+            'rate': self.rate,
+            'burst': self.burst,
+            'throttle': self.throttle,
+            'shared_budget': self.shared_budget.path if self.shared_budget is not None else None,
+            'paused': {host: round(until - time.monotonic(), 1)
+                       for host, until in list(self._paused_until.items()) if until > time.monotonic()},
+            'queue_depth': queue_depth,
+            'priorities': priorities
+        }
+
+class SharedRateBudget:
+    """Request budget shared by every process that uses the same SQLite file
+
+    Gives each request a send time per host with the generic cell rate
+    algorithm: requests are spaced 1/rate apart, with up to `burst` sent back
+    to back, however many API and worker processes are scraping at once.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS rate_budget (host TEXT PRIMARY KEY, next_at REAL NOT NULL)")
+
+    def reserve(self, host, rate, burst):
+        """Reserve the next send slot for host, returning how many seconds to wait for it"""
+        interval = 1 / rate
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT next_at FROM rate_budget WHERE host = ?", (host,)).fetchone()
+                slot = max(now, row[0]) if row else now
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_budget (host, next_at) VALUES (?, ?)", (host, slot + interval)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return max(0.0, slot - (burst - 1) * interval - now)
+
+    def pause(self, host, seconds, rate, burst):
+        """Push host's next send slot back so that reserve() makes every process wait at least `seconds`"""
+        # reserve() lets a burst through ahead of next_at; the pause must outlast it
+        next_at = time.time() + seconds + (burst - 1) / rate
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO rate_budget (host, next_at) VALUES (?, ?) "
+                "ON CONFLICT (host) DO UPDATE SET next_at = MAX(next_at, excluded.next_at)",
+                (host, next_at)
+            )
+
+# Shared scheduler for all outbound requests
+scheduler = RequestScheduler(shared_budget=SharedRateBudget(RATE_BUDGET_PATH) if RATE_BUDGET_PATH else None)
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait first
+
+    Transport errors and RETRYABLE_STATUSES are retried; other statuses (a 404
+    for a removed profile, say) fail immediately. A Retry-After header on the
+    response takes precedence over exponential backoff and is not capped;
+    fetch_url_async() also pauses the host in the scheduler for that long.
+    """
+
+    def __init__(self, max_attempts=RETRY_MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY,
+                 retryable_statuses=RETRYABLE_STATUSES):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_statuses = retryable_statuses
+
+    def is_retryable(self, error):
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retryable_statuses
+        return isinstance(error, httpx.TransportError)
+
+    def delay(self, attempt, error):
+        """Seconds to wait before retry number `attempt` (1-based)"""
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return min(self.max_delay, self.base_delay * (2 ** (attempt - 1)) + random.uniform(0, self.base_delay))
+
+    @staticmethod
+    def retry_after(error):
+        """The Retry-After header of a failed response in seconds, or None"""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return None
+        value = error.response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+class CircuitBreaker:
+    """Slows the whole request scheduler when recent requests keep failing
+
+    Tracks the outcome of the last `window` requests. When at least
+    `error_ratio` of them failed with a retryable error, the breaker opens and
+    divides the scheduler's rate by `slowdown` for `cooldown` seconds, after
+    which the full rate is tried again. Must be used from the fetch engine's
+    event loop.
+    """
+
+    def __init__(self, scheduler, window=BREAKER_WINDOW, error_ratio=BREAKER_ERROR_RATIO,
+                 slowdown=BREAKER_SLOWDOWN, cooldown=BREAKER_COOLDOWN):
+        self.scheduler = scheduler
+        self.window = window
+        self.error_ratio = error_ratio
+        self.slowdown = slowdown
+        self.cooldown = cooldown
+        self._outcomes = collections.deque(maxlen=window)  # True for failures
+        self._opened_at = None
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def record(self, failed):
+        now = time.monotonic()
+        if self.is_open and now - self._opened_at >= self.cooldown:
+            logger.info("Circuit breaker closed, restoring the full request rate")
+            self._opened_at = None
+            self._outcomes.clear()
+            self.scheduler.throttle = 1
+        
+        self._outcomes.append(failed)
+        if (not self.is_open and len(self._outcomes) >= self.window // 2
+                and sum(self._outcomes) >= self.error_ratio * len(self._outcomes)):
+            logger.warning(f"Circuit breaker opened after {sum(self._outcomes)}/{len(self._outcomes)} failed requests, "
+                           f"slowing requests {self.slowdown}x for {self.cooldown}s")
+            self._opened_at = now
+            self.scheduler.throttle = self.slowdown
+            metrics.inc('breaker_trips_total')
+
+# Shared retry policy and circuit breaker for all outbound requests
+retry_policy = RetryPolicy()
+breaker = CircuitBreaker(scheduler)
+
 # Session management
-def get_session():
-    """Create a new session with randomized user agent"""
-    session = requests.Session()
-    session.headers.update({
+def get_http_client():
+    """The connection pool shared by every request, created on first use
+
+    Connections are kept alive and reused across searches, profiles, pages and
+    faculty, over HTTP/2 when h2 is installed. httpx negotiates and decodes
+    gzip, and brotli when the brotli package is installed. The client carries
+    no headers of its own; see get_request_headers(). Must be used from the
+    fetch engine's event loop.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            ),
+            http2=HTTP2_AVAILABLE,
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True
+        )
+    return _http_client
+
+def get_request_headers():
+    """Browser-like request headers with a randomized user agent"""
+    return {
         'User-Agent': random.choice(USER_AGENTS),
         'Accept-Language': 'en-US,en;q=0.9',
         'Accept': 'text/html,application/xhtml+xml,application/xml',
-        'Referer': 'https://scholar.google.com/'
-    })
-    return session
-
-def retry_on_error(max_retries=3, delay=2):
-    """Decorator to retry functions on error with exponential backoff"""
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < max_retries:
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    retries += 1
-                    wait_time = delay * (2 ** retries) + random.uniform(0, 1)
-                    logger.warning(f"Error in {func.__name__}: {e}. Retrying in {wait_time:.2f}s ({retries}/{max_retries})")
-                    time.sleep(wait_time)
+        'Referer': f'{SCHOLAR_BASE_URL}/'
+    }
+
+class ScrapeSession:
+    """A run of related requests (a search and its profile, or a publication walk) sharing one set of headers
+
+    Sessions hold no connections: requests go through the shared pool from
+    get_http_client(), so there is nothing to close.
+    """
+
+    def __init__(self):
+        self.headers = get_request_headers()
+
+    async def get(self, url, headers=None, **kwargs):
+        headers = {**self.headers, **headers} if headers else self.headers
+        return await get_http_client().get(url, headers=headers, **kwargs)
+
+def get_session():
+    """Start a session with randomized user agent over the shared connection pool"""
+    return ScrapeSession()
+
+# Result cache
+# Entries are JSON documents, zlib-compressed on disk. Search queries map to a
+# Scholar author id ("query:<name>|<institution>", the author-id resolution
+# index, kept for AUTHOR_INDEX_TTL), profiles are stored once
+# per author ("author:<id>"), and the last-seen publication list per author
+# ("publications:<id>") is kept longer as the baseline for incremental refreshes.
+class MemoryCache:
+    """In-process cache with TTL and LRU eviction
+
+    Like SQLiteCache, an entry may carry a bytes body next to its value, kept
+    as given; get(key, with_body=True) returns (value, body).
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value, body)
+        self._lock = threading.Lock()
+
+    def get(self, key, with_body=False):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return (None, None) if with_body else None
+            expires_at, value, body = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return (None, None) if with_body else None
+            self._entries.move_to_end(key)
+            return (value, body) if with_body else value
+
+    def set(self, key, value, ttl=CACHE_TIMEOUT, body=None):
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+class SQLiteCache:
+    """Cache in a SQLite file, shared across restarts and worker processes, with TTL and LRU eviction
+
+    Values are stored as compressed JSON. An entry's bytes body, if any, goes
+    in its own BLOB column as given, so already-compressed data isn't encoded
+    or compressed again.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL, body BLOB)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        # Caches created before entries had bodies
+        if 'body' not in [row[1] for row in self._conn.execute("PRAGMA table_info(cache)")]:
+            self._conn.execute("ALTER TABLE cache ADD COLUMN body BLOB")
+
+    def get(self, key, with_body=False):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at{', body' if with_body else ''} FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return (None, None) if with_body else None
+            value, expires_at = row[:2]
+            if expires_at is not None and expires_at < now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return (None, None) if with_body else None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        value = json.loads(zlib.decompress(value))
+        return (value, row[2]) if with_body else value
+
+    def set(self, key, value, ttl=CACHE_TIMEOUT, body=None):
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        blob = zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at, body) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, expires_at, now, body)
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                    (excess,)
+                )
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+class MeteredCache:
+    """Wraps a cache backend, counting hits and misses per key kind (the prefix before ':')
+
+    Coroutines use the *_async methods, which run the backend in the executor
+    so that SQLite I/O stays off the fetch engine's loop.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self, key, with_body=False):
+        entry = self.backend.get(key, with_body)
+        value = entry[0] if with_body else entry
+        metrics.inc('cache_requests_total', kind=key.split(':', 1)[0], result='miss' if value is None else 'hit')
+        return entry
+
+    def set(self, key, value, ttl=CACHE_TIMEOUT, body=None):
+        self.backend.set(key, value, ttl, body)
+
+    def delete(self, key):
+        self.backend.delete(key)
+
+    async def get_async(self, key, with_body=False):
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key, with_body)
+
+    async def set_async(self, key, value, ttl=CACHE_TIMEOUT, body=None):
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, value, ttl, body)
+
+    async def delete_async(self, key):
+        await asyncio.get_running_loop().run_in_executor(None, self.delete, key)
+
+    def __len__(self):
+        return len(self.backend)
+
+def create_cache_backend(backend=CACHE_BACKEND, path=CACHE_PATH, max_entries=CACHE_MAX_ENTRIES):
+    """Build the configured cache backend"""
+    if backend == 'memory':
+        return MeteredCache(MemoryCache(max_entries))
+    if backend == 'sqlite':
+        return MeteredCache(SQLiteCache(path, max_entries))
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+# Shared cache to avoid duplicate searches
+faculty_cache = create_cache_backend()
+
+# Raw Scholar pages ("page:<url>") and their memoized parses ("parsed:..."), kept
+# apart so that bulky pages never evict search and profile entries
+page_cache = create_cache_backend(path=PAGE_CACHE_PATH, max_entries=PAGE_CACHE_MAX_ENTRIES)
+
+def content_hash(body):
+    """Short content hash of a page body"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+# Download results
+class ResultStore:
+    """Bounded store of downloadable publication DataFrames keyed by result id
+
+    Each search or upload job gets its own result id, so concurrent users never
+    see each other's downloads. Least recently used result sets beyond
+    max_entries or max_rows are spilled to Parquet in spill_dir when pyarrow is
+    installed, and dropped otherwise.
+    """
+
+    def __init__(self, max_entries=RESULT_STORE_MAX_ENTRIES, max_rows=RESULT_STORE_MAX_ROWS, spill_dir=RESULT_SPILL_DIR):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.spill_dir = spill_dir
+        self._results = OrderedDict()  # result id -> DataFrame, least recently used first
+        self._rows = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_id():
+        return uuid.uuid4().hex
+
+    def _spill_path(self, result_id):
+        # Result ids are uuid hex strings; anything else never touches the filesystem
+        if not re.fullmatch(r'[0-9a-f]{32}', result_id):
+            return None
+        return os.path.join(self.spill_dir, f"{result_id}.parquet")
+
+    def put(self, result_id, df):
+        with self._lock:
+            if result_id in self._results:
+                self._rows -= len(self._results.pop(result_id))
+            self._results[result_id] = df
+            self._rows += len(df)
+            
+            evicted = []
+            while len(self._results) > 1 and (len(self._results) > self.max_entries or self._rows > self.max_rows):
+                old_id, old_df = self._results.popitem(last=False)
+                self._rows -= len(old_df)
+                evicted.append((old_id, old_df))
+        
+        for old_id, old_df in evicted:
+            self._spill(old_id, old_df)
+
+    def get(self, result_id):
+        with self._lock:
+            df = self._results.get(result_id)
+            if df is not None:
+                self._results.move_to_end(result_id)
+                return df
+        
+        path = self._spill_path(result_id)
+        if PARQUET_AVAILABLE and path and os.path.exists(path):
+            return pd.read_parquet(path)
+        return None
+
+    def _spill(self, result_id, df):
+        path = self._spill_path(result_id)
+        if not PARQUET_AVAILABLE or not path:
+            logger.info(f"Dropped result set {result_id} ({len(df)} rows) from the result store")
+            return
+        
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            df.to_parquet(path, index=False)
+            logger.info(f"Spilled result set {result_id} ({len(df)} rows) to {path}")
             
-            # If we get here, all retries failed
-            logger.error(f"All retries failed for {func.__name__}")
-            return None, None
-        return wrapper
-    return decorator
+            # Clean up spilled result sets nobody downloaded in time
+            cutoff = time.time() - RESULT_SPILL_TTL
+            for entry in os.scandir(self.spill_dir):
+                if entry.name.endswith('.parquet') and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+        except Exception as e:
+            logger.error(f"Error spilling result set {result_id}: {e}")
+
+# Per-search / per-job results available to /download
+result_store = ResultStore()
+
+def normalize_query(name, institution=None):
+    """Normalize a name/institution pair into a stable cache key component"""
+    def clean(value):
+        return ' '.join(str(value).lower().split()) if value else ''
+    return f"{clean(name)}|{clean(institution)}"
+
+def parse_scholar_id(value):
+    """Extract a Scholar author id from a bare id or a profile URL, or None if it isn't one"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    value = str(value).strip()
+    match = re.search(r'user=([^&#]+)', value)
+    if match:
+        value = match.group(1)
+    return value if re.fullmatch(r'[\w-]+', value) else None
+
+async def lookup_author_index_async(name, institution=None):
+    """Return the indexed author resolution for a query, or None if unknown or due for re-verification"""
+    entry = await faculty_cache.get_async(f"query:{normalize_query(name, institution)}")
+    if not entry or 'name' not in entry:
+        return None
+    
+    # Weak (e.g. name-only) matches are re-resolved periodically in case a better profile appears
+    age = time.time() - entry['verified_at']
+    if entry['confidence'] < AUTHOR_INDEX_MIN_CONFIDENCE and age > AUTHOR_INDEX_REVERIFY_AGE:
+        return None
+    return entry
+
+async def record_author_resolution_async(name, institution, author, confidence):
+    """Remember which Scholar author a name/institution query resolved to"""
+    await faculty_cache.set_async(f"query:{normalize_query(name, institution)}", {
+        'author_id': author['id'],
+        'name': author['name'],
+        'affiliation': author['affiliation'],
+        'confidence': confidence,
+        'verified_at': time.time()
+    }, ttl=AUTHOR_INDEX_TTL)
+
+def encode_publications(df):
+    """Serialize a publications DataFrame as compact columns + rows"""
+    return {'columns': df.columns.tolist(), 'rows': df.astype(object).where(df.notna(), None).values.tolist()}
+
+def decode_publications(data):
+    """Rebuild a typed publications DataFrame from encode_publications() output"""
+    return normalize_publications(pd.DataFrame(data['rows'], columns=data['columns']))
+
+def sort_publications(df):
+    """Sort publications newest first, keeping rows without a year at the top"""
+    if df.empty:
+        return df
+    with metrics.span('dataframe_seconds', stage='sort'):
+        return df.sort_values(by='Year', ascending=False, na_position='first', kind='stable')
+
+def publication_key(title):
+    """Normalize a publication title for comparing against known publications"""
+    return ' '.join(title.lower().split())
+
+def combine_publications(frames):
+    """Concatenate publication DataFrames once, restoring the categorical columns concat widens"""
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return publications_frame(new_publication_columns())
+    return normalize_publications(pd.concat(frames, ignore_index=True))
 
 def cache_result(func):
     @functools.wraps(func)
-    def wrapper(name, institution=None):
-        cache_key = f"{name}:{institution}"
-        current_time = time.time()
-        
-        # Check if result exists in cache and is not expired
-        if cache_key in faculty_cache:
-            cache_time, profile, df = faculty_cache[cache_key]
-            if current_time - cache_time < CACHE_TIMEOUT:
-                logger.info(f"Cache hit for {name}")
-                return profile, df
-        
-        # Call the original function if not in cache or expired
-        profile, df = func(name, institution)
+    async def wrapper(name, institution=None, scholar_id=None):
+        query_key = f"query:{normalize_query(name, institution)}"
         
-        # Cache the result with current timestamp
-        if profile and df is not None and not df.empty:
-            faculty_cache[cache_key] = (current_time, profile, df)
-            logger.info(f"Cached result for {name}")
+        # Check if the query resolved to an author whose profile and publications are still fresh
+        resolved = {'author_id': scholar_id} if scholar_id else await faculty_cache.get_async(query_key)
+        if resolved:
+            profile = await get_cached_profile_async(resolved['author_id'])
+            known = await faculty_cache.get_async(f"publications:{resolved['author_id']}")
+            if profile and known and time.time() - known.get('updated_at', 0) < CACHE_TIMEOUT:
+                logger.info(f"Cache hit for {name}")
+                return profile, sort_publications(decode_publications(known['publications']))
         
-        return profile, df
+        # Call the original function if not in cache or expired. It stores the
+        # query index, profile and publications entries as it fetches them, and
+        # identical lookups already in progress share one scrape.
+        return await single_flight(
+            f"author:{scholar_id}" if scholar_id else query_key,
+            lambda: func(name, institution, scholar_id)
+        )
     return wrapper
 
-@backoff.on_exception(backoff.expo, 
-                     (requests.exceptions.RequestException, requests.exceptions.HTTPError),
-                     max_tries=3)
-def fetch_url(url, session=None):
-    """Fetch URL with backoff and random delays to avoid detection"""
-    if session is None:
-        session = get_session()
+async def fetch_url_async(url, session=None, raw=False):
+    """Fetch URL under the shared retry policy, paced by the request scheduler within the global request budget
+
+    This is the only layer that retries requests. Returns the decoded text, or
+    the undecoded body bytes when raw is set.
+    
+    Bodies are kept compressed in page_cache with their content hash and
+    validators. A page fetched before is requested conditionally, and a 304
+    reuses the stored body; either way an unchanged body has the same hash,
+    so run_parser() skips parsing it again.
+    """
+    session = session or get_session()
+    loop = asyncio.get_running_loop()
+    page_key = f"page:{url}"
+    cached, cached_body = await loop.run_in_executor(None, functools.partial(page_cache.get, page_key, with_body=True))
+    if cached_body is None:
+        # Entries from before bodies had their own column
+        cached = None
+    validators = {}
+    if cached:
+        if cached.get('etag'):
+            validators['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            validators['If-Modified-Since'] = cached['last_modified']
     
-    # Add random delay to mimic human behavior
-    time.sleep(random.uniform(1, 3))
+    attempt = 1
+    while True:
+        try:
+            response = await fetch_once_async(url, session, validators)
+            breaker.record(failed=False)
+            
+            if response.status_code == 304 and cached:
+                metrics.inc('page_fetches_total', result='not_modified')
+                body = zlib.decompress(cached_body)
+                encoding = cached['encoding']
+            else:
+                body = response.content
+                encoding = response.encoding or 'utf-8'
+                body_hash = content_hash(body)
+                metrics.inc('page_fetches_total', result='new' if not cached else
+                            'unchanged' if cached['hash'] == body_hash else 'changed')
+                await loop.run_in_executor(None, functools.partial(page_cache.set, page_key, {
+                    'hash': body_hash,
+                    'encoding': encoding,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'fetched_at': time.time()
+                }, PAGE_CACHE_TTL, body=cached_body if cached and cached['hash'] == body_hash else zlib.compress(body)))
+            return body if raw else body.decode(encoding, errors='replace')
+        except httpx.HTTPError as e:
+            retryable = retry_policy.is_retryable(e)
+            breaker.record(failed=retryable)
+            retry_after = retry_policy.retry_after(e)
+            if retry_after:
+                # The server asked for a break from this host, not just from this request
+                await scheduler.pause(urlparse(url).netloc, retry_after)
+            if not retryable or attempt >= retry_policy.max_attempts:
+                raise
+            
+            wait_time = retry_policy.delay(attempt, e)
+            reason = str(e.response.status_code) if isinstance(e, httpx.HTTPStatusError) else 'transport'
+            logger.warning(f"Request to {url} failed ({e}). Retrying in {wait_time:.2f}s ({attempt}/{retry_policy.max_attempts - 1})")
+            metrics.inc('retries_total', reason=reason)
+            metrics.observe('retry_sleep_seconds', wait_time)
+            await asyncio.sleep(wait_time)
+            attempt += 1
+
+async def fetch_once_async(url, session, headers=None):
+    """Make a single request once the scheduler and the global request budget allow it
+
+    headers are sent on top of the session's; a 304 answer to conditional ones is returned, not raised.
+    """
+    # Wait for the scheduler to grant this host a token instead of sleeping blindly
+    waited = await scheduler.acquire(urlparse(url).netloc)
+    metrics.observe('fetch_scheduler_wait_seconds', waited)
     
-    response = session.get(url, timeout=15)
-    response.raise_for_status()
-    return response.text
+    queued_at = time.perf_counter()
+    async with get_request_semaphore():
+        started_at = time.perf_counter()
+        metrics.observe('fetch_semaphore_wait_seconds', started_at - queued_at)
+        try:
+            response = await session.get(url, timeout=HTTP_TIMEOUT, headers=headers)
+        except httpx.HTTPError:
+            metrics.inc('fetch_requests_total', status='error')
+            raise
+        finally:
+            metrics.observe('fetch_network_seconds', time.perf_counter() - started_at)
+    metrics.inc('fetch_requests_total', status=response.status_code)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
 
-@retry_on_error(max_retries=3, delay=2)
-def fetch_author(name, institution=None):
+def fetch_url(url, session=None):
+    """Synchronous wrapper around fetch_url_async"""
+    return run_async(fetch_url_async(url, session))
+
+async def fetch_author_async(name, institution=None):
     """Fetch author profile using custom scraping, with fallback to name-only search if institution match fails"""
     try:
+        # Skip the search step entirely when this query was resolved before
+        resolved = await lookup_author_index_async(name, institution)
+        if resolved:
+            logger.info(f"Author index hit for '{name}': {resolved['author_id']} (confidence {resolved['confidence']:.2f})")
+            selected_author = {'id': resolved['author_id'], 'name': resolved['name'], 'affiliation': resolved['affiliation']}
+            try:
+                return await get_author_profile_async(selected_author)
+            except httpx.HTTPStatusError as e:
+                # Rate limiting and server errors say nothing about the entry; searching again would only add requests
+                if e.response.status_code not in (404, 410):
+                    raise
+                # The profile was removed or merged; resolve it again
+                logger.warning(f"Indexed profile {resolved['author_id']} for '{name}' failed ({e}). Searching again...")
+                await faculty_cache.delete_async(f"query:{normalize_query(name, institution)}")
+        
         # First attempt: search with name and institution
         if institution:
             search_query = quote_plus(f"{name} {institution}")
-            url = f"https://scholar.google.com/citations?view_op=search_authors&mauthors={search_query}&hl=en"
+            url = f"{SCHOLAR_BASE_URL}/citations?view_op=search_authors&mauthors={search_query}&hl=en"
             
             logger.info(f"Searching for author: '{name}' with institution: '{institution}'")
-            logger.info(f"Search URL: {url}")
+            logger.log(ROW_LOG_LEVEL, f"Search URL: {url}")
             
             session = get_session()
-            html = fetch_url(url, session)
-            soup = BeautifulSoup(html, 'html.parser')
+            html = await fetch_url_async(url, session, raw=True)
             
-            # Find all author results
-            author_elements = soup.select('.gsc_1usr')
+            # Find all author results and select the one with an institution match
+            candidate_count, selected_author = await run_parser(parse_author_search, html, name, institution)
             
             # If we found results with institution, process them
-            if author_elements:
-                logger.info(f"Found {len(author_elements)} potential authors for '{name}' with institution")
-                
-                # Select author with institution match
-                selected_author = select_best_author_match(author_elements, name, institution)
+            if candidate_count:
+                logger.info(f"Found {candidate_count} potential authors for '{name}' with institution")
                 
                 if selected_author:
                     logger.info(f"Selected author with institution match: {selected_author['name']}")
                     # Continue with existing code to fetch profile
-                    return get_author_profile(selected_author, session)
+                    author_profile = await get_author_profile_async(selected_author, session)
+                    await record_author_resolution_async(name, institution, selected_author, selected_author['match_quality'])
+                    return author_profile
             
             # If we reach here, no suitable match was found with institution
             logger.warning(f"No suitable author found for {name} with institution {institution}. Trying name-only search...")
         
         # Second attempt: search with name only
         search_query = quote_plus(f"{name}")
-        url = f"https://scholar.google.com/citations?view_op=search_authors&mauthors={search_query}&hl=en"
+        url = f"{SCHOLAR_BASE_URL}/citations?view_op=search_authors&mauthors={search_query}&hl=en"
         
         logger.info(f"Searching for author using name only: '{name}'")
-        logger.info(f"Search URL: {url}")
+        logger.log(ROW_LOG_LEVEL, f"Search URL: {url}")
         
         session = get_session()
-        html = fetch_url(url, session)
-        soup = BeautifulSoup(html, 'html.parser')
+        html = await fetch_url_async(url, session, raw=True)
         
-        # Find all author results
-        author_elements = soup.select('.gsc_1usr')
+        # Find all author results and select the most relevant one
+        candidate_count, selected_author = await run_parser(parse_author_search, html, name, None)
         
-        if not author_elements:
+        if not candidate_count:
             logger.warning(f"No author results found for {name}")
             return None
         
-        logger.info(f"Found {len(author_elements)} potential authors for '{name}' (name-only search)")
-        
-        # Select the most relevant author
-        selected_author = select_best_author_match(author_elements, name, None)
+        logger.info(f"Found {candidate_count} potential authors for '{name}' (name-only search)")
         
         if not selected_author:
             logger.warning(f"No suitable author found for {name}")
@@ -177,12 +1244,33 @@ def fetch_author(name, institution=None):
         # Log the selected author
         logger.info(f"Final selection for '{name}': {selected_author['name']} from {selected_author['affiliation']} (name-only search)")
         
-        return get_author_profile(selected_author, session)
+        author_profile = await get_author_profile_async(selected_author, session)
+        await record_author_resolution_async(name, institution, selected_author, selected_author['match_quality'])
+        return author_profile
         
     except Exception as e:
         logger.error(f"Error fetching author {name}: {e}")
         raise
 
+def fetch_author(name, institution=None):
+    """Synchronous wrapper around fetch_author_async"""
+    return run_async(fetch_author_async(name, institution))
+
+async def fetch_author_by_id_async(scholar_id, name=None, institution=None):
+    """Fetch an author profile directly from a known Scholar id, bypassing search"""
+    try:
+        logger.info(f"Fetching author '{name}' directly by Scholar id {scholar_id}")
+        
+        # Name and affiliation are read from the profile page itself
+        author_profile = await get_author_profile_async({'id': scholar_id, 'name': None, 'affiliation': None})
+        if name:
+            await record_author_resolution_async(name, institution, author_profile, 1.0)
+        return author_profile
+    
+    except Exception as e:
+        logger.error(f"Error fetching author {scholar_id}: {e}")
+        raise
+
 def select_best_author_match(author_elements, name, institution=None):
     """Helper function to select the best author match from a list of author elements"""
     selected_author = None
@@ -203,7 +1291,7 @@ def select_best_author_match(author_elements, name, institution=None):
         affiliation_elem = author.select_one('.gs_ai_aff')
         affiliation = affiliation_elem.text.strip() if affiliation_elem else "N/A"
         
-        logger.info(f"Candidate {i+1}: {author_name} from {affiliation}")
+        logger.log(ROW_LOG_LEVEL, f"Candidate {i+1}: {author_name} from {affiliation}")
         
         # Institution matching if provided
         if institution:
@@ -215,7 +1303,7 @@ def select_best_author_match(author_elements, name, institution=None):
             match_score = sum(1 for word in inst_words if len(word) > 2 and word in affiliation_lower)
             match_percentage = match_score / len(inst_words) if inst_words else 0
             
-            logger.info(f"Institution match score: {match_score}/{len(inst_words)} ({match_percentage:.2%})")
+            logger.log(ROW_LOG_LEVEL, f"Institution match score: {match_score}/{len(inst_words)} ({match_percentage:.2%})")
             
             if match_percentage > 0.3:  # If more than 30% of words match
                 selected_author = {
@@ -238,12 +1326,28 @@ def select_best_author_match(author_elements, name, institution=None):
     
     return selected_author
 
-def get_author_profile(selected_author, session):
+def parse_author_search(html, name, institution=None):
+    """Parse an author search results page, returning (candidate count, best match or None)"""
+    soup = bs4.BeautifulSoup(html, BS4_PARSER)
+    author_elements = soup.select('.gsc_1usr')
+    if not author_elements:
+        return 0, None
+    return len(author_elements), select_best_author_match(author_elements, name, institution)
+
+async def get_author_profile_async(selected_author, session=None):
     """Helper function to get detailed author profile"""
     # Fetch the author's profile page to get more details
-    author_url = f"https://scholar.google.com/citations?user={selected_author['id']}&hl=en"
-    profile_html = fetch_url(author_url, session)
-    profile_soup = BeautifulSoup(profile_html, 'html.parser')
+    author_url = f"{SCHOLAR_BASE_URL}/citations?user={selected_author['id']}&hl=en"
+    profile_html = await fetch_url_async(author_url, session, raw=True)
+    return await run_parser(parse_author_profile, profile_html, selected_author)
+
+def get_author_profile(selected_author, session=None):
+    """Synchronous wrapper around get_author_profile_async"""
+    return run_async(get_author_profile_async(selected_author, session))
+
+def parse_author_profile(profile_html, selected_author):
+    """Extract h-index, i10-index and photo from a profile page into a complete author profile"""
+    profile_soup = bs4.BeautifulSoup(profile_html, BS4_PARSER)
     
     # Extract h-index and i10-index
     h_index = "N/A"
@@ -258,11 +1362,21 @@ def get_author_profile(selected_author, session):
     photo_elem = profile_soup.select_one('#gsc_prf_pup-img')
     photo_url = photo_elem['src'] if photo_elem and 'src' in photo_elem.attrs else ""
     
+    # Name and affiliation come from the search results, or the page itself when fetched by id
+    name = selected_author['name']
+    if name is None:
+        name_elem = profile_soup.select_one('#gsc_prf_in')
+        name = name_elem.text.strip() if name_elem else "N/A"
+    affiliation = selected_author['affiliation']
+    if affiliation is None:
+        affiliation_elem = profile_soup.select_one('#gsc_prf_i .gsc_prf_il')
+        affiliation = affiliation_elem.text.strip() if affiliation_elem else "N/A"
+    
     # Complete author profile
     author_profile = {
-        'name': selected_author['name'],
+        'name': name,
         'id': selected_author['id'],
-        'affiliation': selected_author['affiliation'],
+        'affiliation': affiliation,
         'h_index': h_index,
         'i10_index': i10_index,
         'photo': photo_url
@@ -270,210 +1384,818 @@ def get_author_profile(selected_author, session):
     
     return author_profile
 
-def extract_publications_from_html(html):
-    """Extract publication information from HTML page"""
-    publications = []
-    soup = BeautifulSoup(html, 'html.parser')
+def classify_venues(venues):
+    """Determine publication types from a Series of venues, as a categorical"""
+    venues_lower = venues.astype(str).str.lower()
+    types = np.select(
+        [venues_lower.str.contains(JOURNAL_VENUE_PATTERN), venues_lower.str.contains(CONFERENCE_VENUE_PATTERN)],
+        ['Journal', 'Conference'],
+        'Other'
+    )
+    return pd.Categorical(types, dtype=publication_types())
+
+@functools.cache
+def publication_types():
+    """The categorical dtype of the Type column"""
+    return pd.CategoricalDtype(PUBLICATION_TYPES)
+
+def new_publication_columns():
+    """Empty column lists for a parser to fill, one per PUBLICATION_FIELDS entry"""
+    return {field: [] for field in PUBLICATION_FIELDS}
+
+def publications_frame(columns):
+    """Build a typed publications DataFrame from parsed column lists"""
+    with metrics.span('dataframe_seconds', stage='build'):
+        df = pd.DataFrame(columns, columns=list(PUBLICATION_FIELDS))
+        df['Type'] = classify_venues(df['Venue'])
+        return normalize_publications(df)
+
+def normalize_publications(df):
+    """Give a publications DataFrame its compact column types
+
+    Year becomes a nullable integer (missing or non-numeric years are NA),
+    Type and Venue categoricals. Columns from older cache entries, where years
+    are strings and "N/A", are converted the same way.
+    """
+    df = df.reindex(columns=PUBLICATION_COLUMNS + [column for column in df.columns if column not in PUBLICATION_COLUMNS])
+    df['Year'] = pd.to_numeric(df['Year'], errors='coerce').astype('Int64')
+    if not isinstance(df['Type'].dtype, pd.CategoricalDtype) or df['Type'].dtype != publication_types():
+        df['Type'] = df['Type'].astype(publication_types())
+    df['Venue'] = df['Venue'].astype('category')
+    return df
+
+def publication_records(df):
+    """Publications as JSON-ready dicts, with missing years reported as "N/A\""""
+    if df is None or df.empty:
+        return []
+    records = df.astype(object).where(df.notna(), None)
+    if 'Year' in records:
+        records['Year'] = records['Year'].where(records['Year'].notna(), "N/A")
+    return records.to_dict(orient="records")
+
+def parse_publications_page_bs4(html, parser=None):
+    """Parse a publications page once with BeautifulSoup, returning (publication columns, has_more)"""
+    publications = new_publication_columns()
+    soup = bs4.BeautifulSoup(html, parser or BS4_PARSER)
     
     # Find all publication rows
-    pub_elements = soup.select('tr.gsc_a_tr')
-    
-    for pub in pub_elements:
+    for pub in soup.find_all('tr', class_='gsc_a_tr'):
         try:
             # Extract publication title
-            title_elem = pub.select_one('.gsc_a_t a')
+            title_cell = pub.find(class_='gsc_a_t')
+            title_elem = title_cell.find('a') if title_cell else None
             if not title_elem:
                 continue
             title = title_elem.text.strip()
             
             # Extract authors and venue
-            authors_venue_elem = pub.select('.gsc_a_t .gs_gray')
+            authors_venue_elem = title_cell.find_all(class_='gs_gray', limit=2)
             authors = authors_venue_elem[0].text.strip() if len(authors_venue_elem) > 0 else "N/A"
             venue = authors_venue_elem[1].text.strip() if len(authors_venue_elem) > 1 else "N/A"
             
             # Extract year
-            year_elem = pub.select_one('.gsc_a_y span')
+            year_cell = pub.find(class_='gsc_a_y')
+            year_elem = year_cell.find('span') if year_cell else None
             year = year_elem.text.strip() if year_elem else "N/A"
             
-            # Determine publication type based on venue
-            pub_type = "Other"
-            venue_lower = venue.lower()
+            publications['Title'].append(title)
+            publications['Authors'].append(authors)
+            publications['Venue'].append(venue)
+            publications['Year'].append(year)
+            
+        except Exception as e:
+            logger.error(f"Error processing publication: {e}")
+            continue
+    
+    # A missing or disabled "Show more" button means this is the last page
+    show_more_button = soup.find(id='gsc_bpf_more')
+    has_more = bool(show_more_button) and 'disabled' not in show_more_button.attrs
+    
+    return publications, has_more
+
+def parse_publications_page_selectolax(html):
+    """Parse a publications page once with selectolax, returning (publication columns, has_more)"""
+    publications = new_publication_columns()
+    tree = selectolax_lexbor.LexborHTMLParser(html)
+    
+    for pub in tree.css('tr.gsc_a_tr'):
+        try:
+            title_elem = pub.css_first('.gsc_a_t a')
+            if title_elem is None:
+                continue
+            title = title_elem.text().strip()
+            
+            authors_venue_elem = pub.css('.gsc_a_t .gs_gray')
+            authors = authors_venue_elem[0].text().strip() if len(authors_venue_elem) > 0 else "N/A"
+            venue = authors_venue_elem[1].text().strip() if len(authors_venue_elem) > 1 else "N/A"
             
-            if any(k in venue_lower for k in ["journal", "transactions"]):
-                pub_type = "Journal"
-            elif any(k in venue_lower for k in ["conference", "proceedings", "symposium"]):
-                pub_type = "Conference"
+            year_elem = pub.css_first('.gsc_a_y span')
+            year = year_elem.text().strip() if year_elem is not None else "N/A"
             
-            publications.append({
-                "Title": title,
-                "Year": year if year != "" else "N/A",
-                "Type": pub_type,
-                "Venue": venue,
-                "Authors": authors
-            })
+            publications['Title'].append(title)
+            publications['Authors'].append(authors)
+            publications['Venue'].append(venue)
+            publications['Year'].append(year)
             
         except Exception as e:
             logger.error(f"Error processing publication: {e}")
             continue
     
-    return publications
+    show_more_button = tree.css_first('#gsc_bpf_more')
+    has_more = show_more_button is not None and 'disabled' not in show_more_button.attributes
+    
+    return publications, has_more
+
+# Publication page parsers by name, fastest available first
+PUBLICATION_PAGE_PARSERS = {}
+if SELECTOLAX_AVAILABLE:
+    PUBLICATION_PAGE_PARSERS['selectolax'] = parse_publications_page_selectolax
+PUBLICATION_PAGE_PARSERS[f'bs4-{BS4_PARSER}'] = parse_publications_page_bs4
+
+def parse_publications_page(html):
+    """Extract publications and pagination state from a publications page in a single parse
+
+    Publications come back as plain column lists (see PUBLICATION_FIELDS),
+    which pickle cheaply from parse workers; publications_frame() types them.
+    """
+    return next(iter(PUBLICATION_PAGE_PARSERS.values()))(html)
+
+def extract_publications_from_html(html):
+    """Extract publication information from HTML page as a DataFrame"""
+    publications, _ = parse_publications_page(html)
+    return publications_frame(publications)
+
+async def fetch_publications_page_async(author_id, page, session=None, sort_by_date=False):
+    """Fetch one page of an author's publications, returning (publication columns, has_more)"""
+    start_index = page * PUBLICATIONS_PAGE_SIZE
+    url = f"{SCHOLAR_BASE_URL}/citations?user={author_id}&hl=en&cstart={start_index}&pagesize={PUBLICATIONS_PAGE_SIZE}"
+    if sort_by_date:
+        url += "&sortby=pubdate"
+    
+    logger.log(ROW_LOG_LEVEL, f"Fetching publications page {page+1} for author {author_id} (starting at {start_index})")
+    
+    html = await fetch_url_async(url, session, raw=True)
+    
+    # Extract publications and pagination state from this page in one parse
+    return await run_parser(parse_publications_page, html)
+
+def save_walk_page(checkpoint_key, page, publications):
+    """Checkpoint one page of a publication walk: the publications it added, then the page to continue from"""
+    faculty_cache.set(f"{checkpoint_key}:{page}", publications, ttl=PUBLICATION_PROGRESS_TTL)
+    faculty_cache.set(checkpoint_key, {'page': page + 1}, ttl=PUBLICATION_PROGRESS_TTL)
+
+def load_walk_progress(checkpoint_key):
+    """(page to continue from, publications collected so far) of a checkpointed walk, or (0, None)"""
+    progress = faculty_cache.get(checkpoint_key)
+    if not progress:
+        return 0, None
+    if 'publications' in progress:
+        return progress['page'], progress['publications']  # Saved whole by earlier versions
+    collected = new_publication_columns()
+    for page in range(progress['page']):
+        publications = faculty_cache.get(f"{checkpoint_key}:{page}")
+        if publications is None:
+            return 0, None  # A page expired or was evicted; start over
+        for field in PUBLICATION_FIELDS:
+            collected[field].extend(publications[field])
+    return progress['page'], collected
+
+def clear_walk_progress(checkpoint_key):
+    """Remove a finished walk's checkpoints"""
+    progress = faculty_cache.get(checkpoint_key)
+    faculty_cache.delete(checkpoint_key)
+    for page in range(progress['page'] if progress else 0):
+        faculty_cache.delete(f"{checkpoint_key}:{page}")
 
-@retry_on_error(max_retries=2, delay=1)
-def fetch_all_publications(author_id, max_pages=10):
-    """Fetch all publications for an author by paginating through results"""
+async def fetch_all_publications_async(author_id, max_pages=10, known_titles=None, start_page=0, collected=None,
+                                       checkpoint_key=None):
+    """Fetch all publications for an author by paginating through results
+
+    When known_titles (a set of publication_key() values) is given, pages are
+    requested newest first and only publications not already known are
+    returned. Paging stops at the first page that holds only known titles or
+    ends in a run of INCREMENTAL_KNOWN_RUN of them.
+
+    Each page is retried by fetch_url_async(); if one still fails, its error
+    propagates. A walk can continue from a page with start_page, passing the
+    publications from the pages before it as collected. With checkpoint_key,
+    each page's publications are saved to the result cache as it is read (see
+    save_walk_page()), so a walk that failed or was interrupted by a restart
+    resumes from its last page.
+
+    Pages are collected column by column and turned into one typed DataFrame
+    at the end.
+    """
     try:
-        all_publications = []
-        session = get_session()
-        page_size = 100  # Maximum page size Google Scholar allows
+        all_publications = collected or new_publication_columns()
+        loop = asyncio.get_running_loop()
         
-        for page in range(max_pages):  # Limit to max_pages to prevent infinite loops
-            start_index = page * page_size
-            url = f"https://scholar.google.com/citations?user={author_id}&hl=en&cstart={start_index}&pagesize={page_size}"
-            
-            logger.info(f"Fetching publications page {page+1} for author {author_id} (starting at {start_index})")
-            
-            html = fetch_url(url, session)
-            
-            # Extract publications from this page
-            page_publications = extract_publications_from_html(html)
+        session = get_session()
+        for page in range(start_page, max_pages):  # Limit to max_pages to prevent infinite loops
+            collected_before = len(all_publications['Title'])
+            page_publications, has_more = await fetch_publications_page_async(
+                author_id, page, session, sort_by_date=known_titles is not None
+            )
             
             # If no publications found, we've reached the end
-            if not page_publications:
+            if not page_publications['Title']:
                 break
+            
+            if known_titles is not None:
+                is_known = [publication_key(title) in known_titles for title in page_publications['Title']]
+                for field in PUBLICATION_FIELDS:
+                    all_publications[field].extend(
+                        value for value, known in zip(page_publications[field], is_known) if not known
+                    )
+                
+                # Pages are newest first, so a trailing run of known titles means the rest is known too
+                trailing_known = 0
+                for known in reversed(is_known):
+                    if not known:
+                        break
+                    trailing_known += 1
                 
-            all_publications.extend(page_publications)
+                if all(is_known) or trailing_known >= INCREMENTAL_KNOWN_RUN:
+                    logger.info(f"Reached known publications for author {author_id} on page {page+1}")
+                    break
+            else:
+                for field in PUBLICATION_FIELDS:
+                    all_publications[field].extend(page_publications[field])
             
-            # Check if there's a "Show more" button indicating more pages
-            soup = BeautifulSoup(html, 'html.parser')
-            show_more_button = soup.select_one('#gsc_bpf_more')
+            if checkpoint_key:
+                await loop.run_in_executor(None, save_walk_page, checkpoint_key, page, {
+                    field: all_publications[field][collected_before:] for field in PUBLICATION_FIELDS
+                })
             
-            # If button is disabled or doesn't exist, we've reached the end
-            if not show_more_button or 'disabled' in show_more_button.attrs:
+            # If the "Show more" button is disabled or doesn't exist, we've reached the end
+            if not has_more:
                 break
-                
-            # Add a delay between pagination requests
-            time.sleep(random.uniform(2, 4))
+            
+            # No sleep between pages: the request scheduler paces every request
         
-        logger.info(f"Retrieved a total of {len(all_publications)} publications for author {author_id}")
-        return all_publications
+        logger.info(f"Retrieved a total of {len(all_publications['Title'])} publications for author {author_id}")
+        return publications_frame(all_publications)
         
     except Exception as e:
         logger.error(f"Error fetching all publications: {e}")
         raise
 
-@cache_result
-def get_faculty_publications(name, institution=None):
-    try:
-        # Fetch author profile
-        author = fetch_author(name, institution)
-        
-        if not author:
-            logger.warning(f"No author found for {name}")
-            return None, None
-        
-        # Extract faculty details
-        profile = {
-            "name": author["name"],
-            "affiliation": author.get("affiliation", "N/A"),
-            "h_index": author.get("h_index", "N/A"),
-            "i10_index": author.get("i10_index", "N/A"),
-            "photo": author.get("photo", ""),
-        }
-        
-        # Fetch all publications (not just first 50)
-        publications = fetch_all_publications(author["id"])
+def fetch_all_publications(author_id, max_pages=10, known_titles=None, start_page=0, collected=None):
+    """Synchronous wrapper around fetch_all_publications_async"""
+    return run_async(fetch_all_publications_async(author_id, max_pages, known_titles, start_page, collected))
+
+async def get_author_publications_async(author_id):
+    """Fetch an author's publications as a DataFrame, refreshing incrementally from the last-seen list when possible"""
+    cache_key = f"publications:{author_id}"
+    current_time = time.time()
+    known = await faculty_cache.get_async(cache_key)
+    
+    if known and current_time - known.get('updated_at', 0) < CACHE_TIMEOUT:
+        return decode_publications(known['publications'])
+    
+    if known and current_time - known['full_fetch_at'] < FULL_REFRESH_INTERVAL:
+        known_publications = decode_publications(known['publications'])
+        known_titles = set(known_publications['Title'].map(publication_key))
         
-        if not publications:
-            logger.warning(f"No publications found for {name}")
-            return profile, pd.DataFrame()
+        try:
+            new_publications = await fetch_all_publications_async(author_id, known_titles=known_titles)
+        except Exception as e:
+            # Fall back to the last-seen list
+            logger.warning(f"Incremental refresh failed for author {author_id} ({e}), using last-seen publications")
+            return known_publications
         
-        # Convert to DataFrame
-        df = pd.DataFrame(publications)
+        logger.info(f"Incremental refresh found {len(new_publications)} new publications for author {author_id}")
+        publications = combine_publications([new_publications, known_publications])
+        full_fetch_at = known['full_fetch_at']
+    else:
+        # A walk that failed or was interrupted part way resumes after the last page it finished
+        progress_key = f"pubprogress:{author_id}"
+        start_page, collected = await asyncio.get_running_loop().run_in_executor(None, load_walk_progress, progress_key)
+        if start_page:
+            logger.info(f"Resuming publications for author {author_id} from page {start_page+1}")
         
-        # Sort by year if not empty
-        if not df.empty:
-            # Create temporary numeric column for sorting
-            df['sort_year'] = pd.to_numeric(df['Year'], errors='coerce').fillna(9999)
-            df = df.sort_values(by='sort_year', ascending=False)  # Newest first
-            df = df.drop('sort_year', axis=1)
+        publications = await fetch_all_publications_async(
+            author_id, start_page=start_page, collected=collected, checkpoint_key=progress_key
+        )
+        await asyncio.get_running_loop().run_in_executor(None, clear_walk_progress, progress_key)
         
-        return profile, df
+        if publications.empty:
+            return publications
+        full_fetch_at = current_time
+    
+    await faculty_cache.set_async(cache_key, {
+        'publications': encode_publications(publications),
+        'full_fetch_at': full_fetch_at,
+        'updated_at': current_time
+    }, ttl=PUBLICATION_HISTORY_TTL)
+    return publications
+
+async def get_publications_page_async(author_id, page):
+    """One PUBLICATIONS_PAGE_SIZE page of an author's publications, newest first, returning (publications, has_more)
+
+    Pages always come from Scholar's own publication-date order, fetched and
+    cached one at a time, so that paging never switches between orders part
+    way through and repeats or skips rows.
+    """
+    cache_key = f"pubpage:{author_id}:{page}"
+    cached = await faculty_cache.get_async(cache_key)
+    if cached:
+        return publication_records(publications_frame(cached['publications'])), cached['has_more']
+    
+    publications, has_more = await single_flight(
+        cache_key,
+        lambda: fetch_publications_page_async(author_id, page, sort_by_date=True)
+    )
+    await faculty_cache.set_async(cache_key, {'publications': publications, 'has_more': has_more})
+    return publication_records(publications_frame(publications)), has_more
+
+async def get_cached_author_publications_async(author_id):
+    """An author's publications if they can be served without fetching, or None
+
+    That is the full list while it is fresh, or the pages a client already
+    paged through to the last one with get_publications_page_async().
+    """
+    known = await faculty_cache.get_async(f"publications:{author_id}")
+    if known and time.time() - known.get('updated_at', 0) < CACHE_TIMEOUT:
+        return decode_publications(known['publications'])
+    
+    pages = []
+    for page in itertools.count():
+        cached = await faculty_cache.get_async(f"pubpage:{author_id}:{page}")
+        if not cached:
+            return None
+        pages.append(publications_frame(cached['publications']))
+        if not cached['has_more']:
+            return combine_publications(pages)
+
+async def prefetch_author_publications_async(author_id):
+    """Fetch and cache an author's full publication list, returning whether any were found"""
+    publications = await single_flight(
+        f"publications:{author_id}",
+        lambda: get_author_publications_async(author_id)
+    )
+    return not publications.empty
+
+_author_downloads = {}  # Author id -> future of the background fetch behind an author download
+_author_downloads_lock = threading.Lock()
+
+def author_download_publications(author_id):
+    """An author's publications for /download, or None while they are being fetched
+
+    Served from the cache when possible (see get_cached_author_publications_async());
+    otherwise one background fetch of the full list is started and the client
+    asks again once it has filled the cache. A failed fetch raises its error
+    to the next call.
+    """
+    publications = run_async(get_cached_author_publications_async(author_id))
+    with _author_downloads_lock:
+        future = _author_downloads.get(author_id)
+        if future is not None and future.done():
+            del _author_downloads[author_id]
+        elif future is None and publications is None:
+            _author_downloads[author_id] = asyncio.run_coroutine_threadsafe(
+                prefetch_author_publications_async(author_id), get_engine_loop()
+            )
+    if publications is not None or future is None or not future.done():
+        return publications
     
+    if not future.result():
+        return publications_frame(new_publication_columns())
+    return run_async(get_cached_author_publications_async(author_id))
+
+async def store_profile_async(author):
+    """Cache the profile fields of a fetched author and return them"""
+    profile = {
+        "name": author["name"],
+        "id": author["id"],
+        "affiliation": author.get("affiliation", "N/A"),
+        "h_index": author.get("h_index", "N/A"),
+        "i10_index": author.get("i10_index", "N/A"),
+        "photo": author.get("photo", ""),
+    }
+    await faculty_cache.set_async(f"author:{profile['id']}", {'profile': profile, 'updated_at': time.time()}, ttl=PROFILE_STALE_TTL)
+    return profile
+
+_background_tasks = set()  # Keeps fire-and-forget refreshes from being garbage collected
+
+async def get_cached_profile_async(author_id):
+    """A cached profile, or None; one older than CACHE_TIMEOUT is still returned while a background refresh runs"""
+    entry = await faculty_cache.get_async(f"author:{author_id}")
+    if not entry:
+        return None
+    if time.time() - entry.get('updated_at', 0) >= CACHE_TIMEOUT:
+        task = asyncio.ensure_future(single_flight(f"refresh:author:{author_id}", lambda: refresh_profile_async(author_id)))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    return entry['profile']
+
+async def refresh_profile_async(author_id):
+    """Re-fetch a stale profile in the background; failures keep serving the stale copy"""
+    try:
+        await store_profile_async(await fetch_author_by_id_async(author_id))
+        metrics.inc('profile_refreshes_total', outcome='done')
+        logger.info(f"Refreshed stale profile {author_id}")
     except Exception as e:
-        logger.error(f"Error in get_faculty_publications: {e}")
+        metrics.inc('profile_refreshes_total', outcome='error')
+        logger.warning(f"Background refresh of profile {author_id} failed: {e}")
+
+async def get_faculty_profile_async(name, institution=None, scholar_id=None):
+    """Resolve a faculty member's profile without paging through their publications
+
+    Cached profiles are served stale-while-revalidate; see get_cached_profile_async().
+    """
+    query_key = f"query:{normalize_query(name, institution)}"
+    resolved = {'author_id': scholar_id} if scholar_id else await faculty_cache.get_async(query_key)
+    if resolved:
+        profile = await get_cached_profile_async(resolved['author_id'])
+        if profile:
+            logger.info(f"Profile cache hit for {name}")
+            return profile
+    
+    # Fetch author profile, skipping the search when the Scholar id is known.
+    # Fetch failures propagate so callers can tell them apart from "not found".
+    if scholar_id:
+        author = await fetch_author_by_id_async(scholar_id, name, institution)
+    else:
+        author = await fetch_author_async(name, institution)
+    
+    if not author:
+        logger.warning(f"No author found for {name}")
+        return None
+    
+    # Extract faculty details
+    return await store_profile_async(author)
+
+@cache_result
+async def get_faculty_publications_async(name, institution=None, scholar_id=None):
+    """Return (profile, publications DataFrame), or (None, None) when no author matches
+
+    Fetch failures raise, so bulk jobs can queue the faculty for a retry.
+    """
+    profile = await get_faculty_profile_async(name, institution, scholar_id)
+    
+    if not profile:
         return None, None
+    
+    # Fetch all publications (not just first 50), incrementally if we've seen this author before.
+    # Different queries resolving to the same author share one fetch.
+    publications = await single_flight(
+        f"publications:{profile['id']}",
+        lambda: get_author_publications_async(profile["id"])
+    )
+    
+    if publications.empty:
+        logger.warning(f"No publications found for {name}")
+        return profile, publications
+    
+    return profile, sort_publications(publications)
 
-def process_faculty(faculty_info):
+def get_faculty_publications(name, institution=None, scholar_id=None):
+    """Synchronous wrapper around get_faculty_publications_async"""
+    return run_async(get_faculty_publications_async(name, institution, scholar_id))
+
+async def process_faculty_async(faculty_info):
     """Process a single faculty member - used in parallel processing"""
     name = faculty_info['name']
     institution = faculty_info.get('institution')
+    scholar_id = faculty_info.get('scholar_id')
     
-    logger.info(f"Processing faculty: {name}")
-    profile, pub_df = get_faculty_publications(name, institution)
+    logger.log(ROW_LOG_LEVEL, f"Processing faculty: {name}")
+    profile, pub_df = await get_faculty_publications_async(name, institution, scholar_id)
     
     if profile and pub_df is not None:
+        # Publications stay a DataFrame until they reach the API; see faculty_result_records()
         return {
             'profile': profile,
-            'publications': pub_df.to_dict(orient="records") if not pub_df.empty else []
+            'publications': pub_df
         }
     return None
 
-def process_excel_file(file):
-    try:
-        # Read Excel file
-        df = pd.read_excel(file)
+def faculty_result_records(faculty_result):
+    """A process_faculty_async() result in its JSON form"""
+    return {
+        'profile': faculty_result['profile'],
+        'publications': publication_records(faculty_result['publications'])
+    }
+
+def get_faculty_profile(name, institution=None, scholar_id=None):
+    """Synchronous wrapper around get_faculty_profile_async"""
+    return run_async(single_flight(
+        f"profile:{scholar_id or normalize_query(name, institution)}",
+        lambda: get_faculty_profile_async(name, institution, scholar_id)
+    ))
+
+def process_faculty(faculty_info):
+    """Synchronous wrapper around process_faculty_async"""
+    return run_async(process_faculty_async(faculty_info))
+
+async def process_faculty_list_async(faculty_list, job=None, indices=None, chunks=None):
+    """Process many faculty concurrently, at most MAX_CONCURRENT_FACULTY at a time
+
+    When a job is given, per-faculty progress and results are recorded on it
+    as each faculty starts and finishes. indices limits processing to those
+    positions in faculty_list, as when resuming a job. chunks, an asyncio.Queue
+    of index lists ending with None, instead schedules faculty as a roster is
+    read into the (growing) faculty_list; results are then in roster order.
+    """
+    # Bulk requests yield to interactive searches in the scheduler queue
+    request_priority.set(PRIORITY_BULK)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FACULTY)
+    
+    async def run_one(index, faculty):
+        async with semaphore:
+            if job:
+                await job.update_async(index, 'running')
+            try:
+                return index, faculty, await process_faculty_async(faculty), None
+            except Exception as e:
+                return index, faculty, None, e
+    
+    if chunks is not None:
+        return await process_faculty_chunks_async(run_one, faculty_list, job, chunks)
+    
+    results = []
+    if indices is None:
+        indices = range(len(faculty_list))
+    
+    for next_done in asyncio.as_completed([run_one(index, faculty_list[index]) for index in indices]):
+        faculty_result = await record_faculty_outcome_async(job, *await next_done)
+        if faculty_result:
+            results.append(faculty_result)
+    
+    return results
+
+async def record_faculty_outcome_async(job, index, faculty, faculty_result, error):
+    """Log and count one faculty's outcome, recording it on job; returns the result if publications were found"""
+    if error:
+        logger.error(f"Error processing {faculty['name']} (Institution: {faculty['institution']}): {error}")
+        metrics.inc('faculty_processed_total', outcome='error')
+        if job:
+            await job.update_async(index, 'error', error=error)
+    elif faculty_result:
+        pub_count = len(faculty_result['publications'])
+        logger.log(ROW_LOG_LEVEL, f"Processed {faculty['name']} (Institution: {faculty['institution']}) - {pub_count} publications found")
+        metrics.inc('faculty_processed_total', outcome='done')
+        if job:
+            await job.update_async(index, 'done', result=faculty_result)
+        return faculty_result
+    else:
+        logger.warning(f"No publications found for {faculty['name']} (Institution: {faculty['institution']})")
+        metrics.inc('faculty_processed_total', outcome='not_found')
+        if job:
+            await job.update_async(index, 'not_found')
+    return None
+
+async def process_faculty_chunks_async(run_one, faculty_list, job, chunks):
+    """Schedule faculty chunk by chunk from a queue fed by a roster reader (see feed_roster())
+
+    Takes the next chunk only while fewer than ROSTER_MAX_PENDING faculty are
+    unfinished, so a large roster is read no faster than it is processed.
+    """
+    async def run_and_record(index):
+        return await record_faculty_outcome_async(job, *await run_one(index, faculty_list[index]))
+    
+    tasks = []
+    pending = set()
+    while True:
+        while len(pending) >= ROSTER_MAX_PENDING:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        chunk = await chunks.get()
+        if chunk is None:
+            break
+        for index in chunk:
+            task = asyncio.ensure_future(run_and_record(index))
+            tasks.append(task)
+            pending.add(task)
+    
+    return [result for result in await asyncio.gather(*tasks) if result]
+
+class RosterError(ValueError):
+    """An uploaded roster that can't be read at all, e.g. an unknown format or no 'Name' column"""
+
+def detect_roster_format(filename, head):
+    """Roster format from the upload's file extension, falling back to sniffing its first bytes"""
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension in ('.xlsx', '.xlsm'):
+        return 'xlsx'
+    if extension in ('.xls', '.csv'):
+        return extension[1:]
+    if extension in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    if head.startswith(b'PK'):
+        return 'xlsx'  # Zip container
+    if head.startswith(b'\xd0\xcf\x11\xe0'):
+        return 'xls'  # OLE2 container
+    if head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'{'):
+        return 'ndjson'
+    return 'csv'
+
+def roster_column(columns, wanted):
+    """The column whose name matches wanted ignoring case, spaces and underscores, or None"""
+    for column in columns:
+        if column is not None and str(column).lower().replace('_', '').replace(' ', '') == wanted:
+            return column
+    return None
+
+def clean_roster_value(value):
+    """A cell as a whitespace-collapsed string, or None when empty"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = ' '.join(str(value).split())
+    return value or None
+
+class RosterReader:
+    """Streams validated, normalized and de-duplicated faculty from an uploaded roster
+
+    Reads .xlsx row by row with openpyxl in read_only mode, .csv and
+    .ndjson/.jsonl line by line, and legacy .xls through pandas, so memory
+    stays flat however large the sheet. The upload is first spooled to a temp
+    file, which lets reading continue after the request has returned; use the
+    reader as a context manager to remove it.
+
+    Rows without a usable name are skipped and reported in `invalid`, and
+    repeated name/institution pairs (or Scholar ids) are collapsed.
+    """
+
+    def __init__(self, file):
+        stream = getattr(file, 'stream', file)
+        filename = getattr(file, 'filename', None)
+        with tempfile.NamedTemporaryFile(prefix='roster-', delete=False) as spool:
+            shutil.copyfileobj(stream, spool)
+            self.path = spool.name
+        try:
+            with open(self.path, 'rb') as f:
+                self.format = detect_roster_format(filename, f.read(8))
+            self.rows = 0
+            self.duplicates = 0
+            self.invalid = []  # Up to ROSTER_MAX_INVALID_REPORTED {'row', 'reason'} entries
+            self.invalid_count = 0
+            self._seen_queries = set()
+            self._columns, self._records = self._open()
+            if self._columns is not None:
+                logger.info(f"Roster columns: {self._columns}")
+                if roster_column(self._columns, 'name') is None:
+                    raise RosterError("Roster file must contain a 'Name' column")
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self):
+        """(header, iterator of (row number, record dict)); header is None for NDJSON, whose keys vary per row"""
+        if self.format == 'xlsx':
+            # A file object, since openpyxl judges a path by its extension; closing the workbook closes it
+            workbook = openpyxl.load_workbook(open(self.path, 'rb'), read_only=True, data_only=True)
+            rows = workbook.active.iter_rows(values_only=True)
+            header = list(next(rows, None) or [])
+            
+            def records():
+                try:
+                    for number, row in enumerate(rows, start=2):
+                        if any(value is not None for value in row):
+                            yield number, dict(zip(header, row))
+                finally:
+                    workbook.close()
+            return header, records()
         
-        # Print the actual columns for debugging
-        logger.info(f"Excel columns: {df.columns.tolist()}")
+        if self.format == 'xls':
+            # No streaming reader exists for the legacy format
+            df = pd.read_excel(self.path)
+            return df.columns.tolist(), enumerate(df.to_dict('records'), start=2)
         
-        # Validate required columns
-        if 'Name' not in df.columns:
-            return None, "Excel file must contain a 'Name' column"
+        if self.format == 'csv':
+            f = open(self.path, newline='', encoding='utf-8-sig')
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            
+            def records():
+                with f:
+                    for row in reader:
+                        if any(value.strip() for value in row):
+                            yield reader.line_num, dict(zip(header, row))
+            return header, records()
         
-        # Determine the institution column if it exists
-        institution_col = None
-        for col in df.columns:
-            if col.lower() == 'institution':
-                institution_col = col
-                break
-                
-        logger.info(f"Institution column found: {institution_col}")
-        
-        # Prepare faculty info list for processing
-        faculty_list = []
-        for idx, row in df.iterrows():
-            name = row['Name']
-            institution = row[institution_col] if institution_col and pd.notna(row[institution_col]) else None
-            faculty_list.append({
-                'name': name,
-                'institution': institution
-            })
-            logger.info(f"Added faculty to process: '{name}' with institution '{institution}'")
-
-        # Limit concurrency for bulk processing to avoid rate limits
-        max_workers = min(3, len(faculty_list))  # Conservative limit
-
-        results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_faculty = {
-                executor.submit(process_faculty, faculty): faculty for faculty in faculty_list
-            }
+        def records():
+            with open(self.path, encoding='utf-8-sig') as f:
+                for number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        record = None
+                    yield number, record if isinstance(record, dict) else None
+        return None, records()
 
-            for future in concurrent.futures.as_completed(future_to_faculty):
-                faculty = future_to_faculty[future]
-                try:
-                    faculty_result = future.result()
-                    if faculty_result:
-                        pub_count = len(faculty_result.get('publications', []))
-                        logger.info(f"Processed {faculty['name']} (Institution: {faculty['institution']}) - {pub_count} publications found")
-                        results.append(faculty_result)
-                    else:
-                        logger.warning(f"No publications found for {faculty['name']} (Institution: {faculty['institution']})")
-                except Exception as e:
-                    logger.error(f"Error processing {faculty['name']} (Institution: {faculty['institution']}): {e}")
+    def _reject(self, number, reason):
+        self.invalid_count += 1
+        if len(self.invalid) < ROSTER_MAX_INVALID_REPORTED:
+            self.invalid.append({'row': number, 'reason': reason})
 
-                # Add a slightly longer delay to prevent rate limiting
-                time.sleep(random.uniform(3, 5))
+    def __iter__(self):
+        """Yield {'name', 'institution', 'scholar_id'} for each new, valid faculty row"""
+        for number, record in self._records:
+            self.rows += 1
+            if record is None:
+                self._reject(number, 'not a JSON object')
+                continue
+            columns = self._columns if self._columns is not None else list(record)
+            name_col = roster_column(columns, 'name')
+            institution_col = roster_column(columns, 'institution')
+            scholar_id_col = roster_column(columns, 'scholarid')
+            
+            name = clean_roster_value(record.get(name_col)) if name_col is not None else None
+            if not name:
+                self._reject(number, 'missing name')
+                continue
+            if len(name) > ROSTER_MAX_NAME_LENGTH or not re.search(r'[^\W\d_]', name):
+                self._reject(number, 'malformed name')
+                continue
+            institution = clean_roster_value(record.get(institution_col)) if institution_col is not None else None
+            if institution and len(institution) > ROSTER_MAX_NAME_LENGTH:
+                institution = None
+            
+            # An optional ScholarID column (bare id or profile URL) bypasses author search
+            raw_scholar_id = clean_roster_value(record.get(scholar_id_col)) if scholar_id_col is not None else None
+            scholar_id = parse_scholar_id(raw_scholar_id)
+            if raw_scholar_id and not scholar_id:
+                logger.warning(f"Ignoring invalid ScholarID for '{name}': {raw_scholar_id}")
+            
+            query = f"id:{scholar_id}" if scholar_id else normalize_query(name, institution)
+            if query in self._seen_queries:
+                self.duplicates += 1
+                logger.log(ROW_LOG_LEVEL, f"Skipping duplicate faculty row: '{name}' with institution '{institution}'")
+                continue
+            self._seen_queries.add(query)
+            logger.log(ROW_LOG_LEVEL, f"Added faculty to process: '{name}' with institution '{institution}'")
+            yield {'name': name, 'institution': institution, 'scholar_id': scholar_id}
+
+    def chunks(self, size=ROSTER_CHUNK_SIZE):
+        """Yield lists of up to size faculty as they are read"""
+        iterator = iter(self)
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    def stats(self):
+        return {
+            'format': self.format,
+            'rows': self.rows,
+            'duplicates': self.duplicates,
+            'invalid': self.invalid_count,
+            'invalid_rows': list(self.invalid)
+        }
+
+    def log_summary(self):
+        logger.info(f"Read {self.rows} {self.format} roster rows: {self.duplicates} duplicates collapsed, "
+                    f"{self.invalid_count} invalid rows skipped")
+
+    def close(self):
+        with contextlib.suppress(OSError):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def open_roster(file):
+    """A RosterReader over an uploaded file, returning (roster, error)"""
+    try:
+        return RosterReader(file), None
+    except RosterError as e:
+        return None, str(e)
+    except Exception as e:
+        logger.error(f"Error reading roster file: {e}")
+        return None, f"Error processing roster file: {e}"
+
+def read_faculty_list(file):
+    """Read all faculty to process from an uploaded roster, returning (faculty_list, error)"""
+    roster, error = open_roster(file)
+    if error:
+        return None, error
+    try:
+        with roster:
+            faculty_list = list(roster)
+    except Exception as e:
+        logger.error(f"Error reading roster file: {e}")
+        return None, f"Error processing roster file: {e}"
+    roster.log_summary()
+    return faculty_list, None
+
+def process_excel_file(file):
+    faculty_list, error = read_faculty_list(file)
+    if error:
+        return None, error
+    
+    try:
+        # Faculty run concurrently on the fetch engine; the request scheduler
+        # keeps the combined request rate within its budget
+        results = run_async(process_faculty_list_async(faculty_list))
 
         return results, None
 
@@ -481,10 +2203,1162 @@ def process_excel_file(file):
         logger.error(f"Error processing Excel file: {e}")
         return None, f"Error processing Excel file: {e}"
 
-@app.route("/", methods=["GET", "POST"])
-def index():
-    global processed_data
+# Publication fingerprint index
+def title_fingerprint(title):
+    """A title reduced to lowercase words, for matching the same work across profiles"""
+    return ' '.join(re.findall(r'\w+', str(title).lower())) if title is not None else ''
+
+def author_surnames(authors):
+    """Lowercase surnames from a Scholar author list such as "J Smith, A Jones, ...\""""
+    if not isinstance(authors, str) or authors.strip() == 'N/A':
+        return frozenset()
+    surnames = (re.findall(r'\w+', name.lower()) for name in authors.split(','))
+    return frozenset(words[-1] for words in surnames if words)
+
+def authors_overlap(a, b):
+    """Whether two surname sets share enough names to be the same author list
+
+    Compared against the shorter list, since profiles truncate long author
+    lists at different lengths. Rows without authors never match.
+    """
+    return bool(a and b) and len(a & b) >= AUTHOR_OVERLAP_THRESHOLD * min(len(a), len(b))
+
+class PublicationIndex:
+    """Groups publication rows that are the same work, e.g. a paper listed by several faculty
+
+    Rows are the same work when their titles match and their author lists
+    overlap (see authors_overlap()), so different papers sharing a title stay
+    apart. Titles match when their fingerprints are equal, or for distinct
+    fingerprints, when MinHash LSH puts them in the same bucket of some band
+    and the Jaccard similarity of their character shingles reaches
+    TITLE_SIMILARITY_THRESHOLD - so building the index stays near-linear in the
+    number of rows rather than comparing every pair of titles. Near-duplicates
+    must contain the same numbers, so "Part 1" and "Part 2" stay apart, and
+    titles of SHORT_TITLE_WORDS words or fewer are too generic to match on
+    alone and also need the same year.
+
+    `works` holds a work id per row, numbered in order of first appearance.
+    """
+    BUCKET_MULTIPLIER = 0x9E3779B97F4A7C15
+
+    @staticmethod
+    @functools.cache
+    def _hash_functions():
+        """Multiply-shift hash functions (a, b), one per permutation; fixed so signatures are comparable across indexes"""
+        rng = np.random.default_rng(20240601)
+        a = rng.integers(0, 1 << 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        b = rng.integers(0, 1 << 63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+        return a, b
+
+    def __init__(self, titles, authors, years=None):
+        years = [None] * len(titles) if years is None else [None if pd.isna(year) else int(year) for year in years]
+        fingerprints = [title_fingerprint(title) for title in titles]
+        
+        # Title matches: one node per distinct fingerprint (plus year, for short titles)
+        keys = [(fingerprint, year if len(fingerprint.split()) <= SHORT_TITLE_WORDS else None)
+                for fingerprint, year in zip(fingerprints, years)]
+        node_of_row, unique_keys = pd.factorize(pd.Series(keys, dtype=object))
+        self.fingerprints = [key[0] for key in unique_keys]
+        self.years = [key[1] for key in unique_keys]
+        self._shingles = [self.shingles(fingerprint) for fingerprint in self.fingerprints]
+        
+        # Within a node, rows with overlapping authors form one group: [surnames seen, first row]
+        self._parent = list(range(len(titles)))
+        self._groups = [[] for _ in unique_keys]
+        for row, (node, row_authors) in enumerate(zip(node_of_row, authors)):
+            self._add_to_groups(self._groups[node], author_surnames(row_authors), row)
+        
+        # Near-duplicate titles: LSH candidates, verified by shingle similarity, then by authors
+        for i, j in self._candidate_pairs():
+            if self._similar(i, j):
+                for surnames_i, row_i in self._groups[i]:
+                    for surnames_j, row_j in self._groups[j]:
+                        if authors_overlap(surnames_i, surnames_j):
+                            self._union(row_i, row_j)
+        
+        self.works = pd.factorize(np.array([self._find(row) for row in range(len(titles))], dtype=np.int64))[0]
+        self.work_count = int(self.works.max()) + 1 if len(self.works) else 0
+
+    def _add_to_groups(self, groups, surnames, row):
+        for group in groups:
+            if authors_overlap(group[0], surnames):
+                # Later rows may list more (or fewer) of the authors
+                group[0] = group[0] | surnames
+                self._union(group[1], row)
+                return
+        groups.append([surnames, row])
+
+    @staticmethod
+    def shingles(fingerprint):
+        """A fingerprint's UTF-8 byte shingles, each packed into one integer"""
+        data = np.frombuffer(fingerprint.encode('utf-8'), dtype=np.uint8).astype(np.uint64)
+        if len(data) <= TITLE_SHINGLE_SIZE:
+            return np.array([int.from_bytes(fingerprint.encode('utf-8'), 'big')], dtype=np.uint64) if len(data) else data
+        count = len(data) - TITLE_SHINGLE_SIZE + 1
+        packed = np.zeros(count, dtype=np.uint64)
+        for offset in range(TITLE_SHINGLE_SIZE):
+            packed = (packed << np.uint64(8)) | data[offset:offset + count]
+        return packed
+
+    def _signatures(self, nodes):
+        """MinHash signatures of the given nodes as an (nodes, MINHASH_PERMUTATIONS) array"""
+        shingles = [self._shingles[node] for node in nodes]
+        starts = np.cumsum([0] + [len(values) for values in shingles[:-1]])
+        # (a * x + b) wraps modulo 2**64; the high bits are the hash
+        a, b = self._hash_functions()
+        permuted = (a[:, None] * np.concatenate(shingles)[None, :] + b[:, None]) >> np.uint64(32)
+        return np.minimum.reduceat(permuted, starts, axis=1).T
+
+    def _candidate_pairs(self):
+        """Node pairs sharing a band bucket; each node is paired with the first node of its bucket"""
+        nodes = np.array([node for node, shingles in enumerate(self._shingles) if len(shingles)], dtype=np.int64)
+        if len(nodes) < 2:
+            return set()
+        signatures = np.concatenate([
+            self._signatures(nodes[start:start + MINHASH_BATCH_TITLES])
+            for start in range(0, len(nodes), MINHASH_BATCH_TITLES)
+        ])
+        
+        rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+        multiplier = np.uint64(self.BUCKET_MULTIPLIER)
+        pairs = set()
+        for band in range(MINHASH_BANDS):
+            # Fold the band's values into one bucket hash per node
+            bucket = np.zeros(len(nodes), dtype=np.uint64)
+            for column in range(band * rows, (band + 1) * rows):
+                bucket = bucket * multiplier + signatures[:, column]
+            first = pd.Series(nodes).groupby(bucket).transform('first').to_numpy()
+            collided = first != nodes
+            pairs.update(zip(first[collided].tolist(), nodes[collided].tolist()))
+        return pairs
+
+    def _similar(self, i, j):
+        if re.findall(r'\d+', self.fingerprints[i]) != re.findall(r'\d+', self.fingerprints[j]):
+            return False
+        if (len(self.fingerprints[i].split()) <= SHORT_TITLE_WORDS or len(self.fingerprints[j].split()) <= SHORT_TITLE_WORDS) \
+                and self.years[i] != self.years[j]:
+            return False
+        a, b = set(self._shingles[i].tolist()), set(self._shingles[j].tolist())
+        return len(a & b) >= TITLE_SIMILARITY_THRESHOLD * len(a | b)
+
+    def _find(self, node):
+        while self._parent[node] != node:
+            self._parent[node] = self._parent[self._parent[node]]
+            node = self._parent[node]
+        return node
+
+    def _union(self, i, j):
+        root_i, root_j = self._find(i), self._find(j)
+        if root_i != root_j:
+            self._parent[max(root_i, root_j)] = min(root_i, root_j)
+
+def with_works(df):
+    """df with a Work column identifying rows that are the same publication, added if missing"""
+    if 'Work' in df or df.empty:
+        return df
+    with metrics.span('dataframe_seconds', stage='work_index'):
+        return df.assign(Work=PublicationIndex(df['Title'].tolist(), df['Authors'].tolist(), df['Year']).works)
+
+def dedupe_publications(df):
+    """One row per work, listing every faculty who has it when df is a bulk results frame"""
+    df = with_works(df)
+    if df.empty:
+        return df
+    unique = df.drop_duplicates('Work')
+    if 'Faculty' in df:
+        faculty = df.groupby('Work', sort=False)['Faculty'].agg(lambda names: '; '.join(dict.fromkeys(map(str, names))))
+        unique = unique.assign(Faculty=unique['Work'].map(faculty))
+    return unique
+
+def collaboration_summary(df):
+    """Unique publication counts and the co-authorship graph of a bulk results frame
+
+    Faculty are identified by Scholar id, so namesakes stay apart, and linked
+    by an edge weighted by the number of works both have on their profiles.
+    """
+    df = with_works(df)
+    if df.empty:
+        return {'department': {'faculty': 0, 'publications': 0, 'unique_publications': 0, 'shared_publications': 0},
+                'institutions': [], 'faculty': [], 'edges': []}
+    if 'Faculty_ID' not in df:
+        # Frames built before ids were recorded
+        df = df.assign(Faculty_ID=df['Faculty'])
+    works = df[['Work', 'Faculty_ID', 'Faculty', 'Faculty_Institution']].astype(
+        {'Faculty_ID': str, 'Faculty': str, 'Faculty_Institution': str}
+    )
+    faculty_works = works.drop_duplicates(['Work', 'Faculty_ID'])
+    shared = faculty_works[faculty_works.duplicated('Work', keep=False)]
+    
+    edges = collections.Counter()
+    for ids in shared.groupby('Work', sort=False)['Faculty_ID'].agg(sorted):
+        edges.update(itertools.combinations(ids, 2))
+    
+    per_faculty = works.groupby('Faculty_ID', sort=False).agg(
+        name=('Faculty', 'first'), institution=('Faculty_Institution', 'first'),
+        publications=('Work', 'size'), unique_publications=('Work', 'nunique')
+    )
+    shared_counts = shared.groupby('Faculty_ID', sort=False)['Work'].nunique()
+    per_institution = works.groupby('Faculty_Institution', sort=False).agg(
+        faculty=('Faculty_ID', 'nunique'), publications=('Work', 'size'), unique_publications=('Work', 'nunique')
+    )
     
+    return {
+        'department': {
+            'faculty': len(per_faculty),
+            'publications': len(works),
+            'unique_publications': int(works['Work'].nunique()),
+            'shared_publications': int(shared['Work'].nunique())
+        },
+        'institutions': [
+            {'institution': institution, **{key: int(value) for key, value in row.items()}}
+            for institution, row in per_institution.iterrows()
+        ],
+        'faculty': [
+            {'id': faculty_id, 'name': row['name'], 'institution': row['institution'],
+             'publications': int(row['publications']), 'unique_publications': int(row['unique_publications']),
+             'shared_publications': int(shared_counts.get(faculty_id, 0))}
+            for faculty_id, row in per_faculty.iterrows()
+        ],
+        'edges': [
+            {'source': source, 'target': target, 'shared_publications': count}
+            for (source, target), count in edges.most_common()
+        ]
+    }
+
+def build_bulk_results_frame(results):
+    """Combine faculty results into one publications DataFrame for download, with a single concatenation
+
+    Rows get a Work id shared by every row that is the same publication (see
+    PublicationIndex), for deduplication and analytics; /download leaves it out
+    of exports unless they are deduplicated.
+    """
+    frames = [
+        # Add faculty name, Scholar id and institution to each publication
+        faculty['publications'].assign(
+            Faculty=faculty['profile']['name'],
+            Faculty_ID=faculty['profile']['id'],
+            Faculty_Institution=faculty['profile']['affiliation']
+        )
+        for faculty in results
+        if not faculty['publications'].empty
+    ]
+    
+    if frames:
+        with metrics.span('dataframe_seconds', stage='bulk_build'):
+            df = combine_publications(frames)
+            for column in ('Faculty', 'Faculty_ID', 'Faculty_Institution'):
+                df[column] = df[column].astype('category')
+        return with_works(df)
+    return pd.DataFrame(columns=PUBLICATION_COLUMNS + ['Faculty', 'Faculty_ID', 'Faculty_Institution', 'Work'])
+
+# Precomputed analytics
+def parse_citation_index(value):
+    """An h-index or i10-index from a profile as an int, or None when unknown"""
+    try:
+        return int(str(value).replace(',', ''))
+    except ValueError:
+        return None
+
+def faculty_aggregates(result):
+    """Summarize one faculty's process_faculty_async() result for the analytics endpoint
+
+    Computed once when the faculty finishes, so serving analytics never
+    touches publication rows.
+    """
+    profile = result['profile']
+    df = result['publications']
+    years = df['Year'].value_counts().sort_index()
+    types = df['Type'].value_counts()
+    venues = df['Venue'].value_counts()
+    return {
+        'name': profile.get('name'),
+        'id': profile.get('id'),
+        'affiliation': profile.get('affiliation'),
+        'h_index': parse_citation_index(profile.get('h_index')),
+        'i10_index': parse_citation_index(profile.get('i10_index')),
+        'publications': len(df),
+        'years': {str(year): int(count) for year, count in years.items()},
+        'types': {str(publication_type): int(count) for publication_type, count in types.items() if count},
+        'venues': {str(venue): int(count) for venue, count in venues.items()
+                   if count and str(venue).strip() not in PLACEHOLDER_VENUES}
+    }
+
+def index_summary(values):
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return None
+    return {
+        'min': values[0],
+        'median': float(np.median(values)),
+        'mean': round(sum(values) / len(values), 2),
+        'max': values[-1]
+    }
+
+class DepartmentAggregates:
+    """Running totals of faculty_aggregates() across a job, updated as each faculty finishes"""
+
+    def __init__(self):
+        self.faculty = 0
+        self.publications = 0
+        self.years = collections.Counter()
+        self.types = collections.Counter()
+        self.venues = collections.Counter()
+        self.h_index = {}  # faculty index -> h-index
+        self.i10_index = {}
+
+    def add(self, index, aggregates, sign=1):
+        self.faculty += sign
+        self.publications += sign * aggregates['publications']
+        for totals, counts in ((self.years, aggregates['years']), (self.types, aggregates['types']),
+                               (self.venues, aggregates['venues'])):
+            if sign > 0:
+                totals.update(counts)
+            else:
+                totals.subtract(counts)
+        if sign > 0:
+            self.h_index[index] = aggregates['h_index']
+            self.i10_index[index] = aggregates['i10_index']
+        else:
+            self.h_index.pop(index, None)
+            self.i10_index.pop(index, None)
+
+    def remove(self, index, aggregates):
+        self.add(index, aggregates, sign=-1)
+
+    def summary(self):
+        return {
+            'faculty': self.faculty,
+            'publications': self.publications,
+            'years': {year: count for year, count in sorted(self.years.items()) if count > 0},
+            'types': {publication_type: count for publication_type, count in self.types.items() if count > 0},
+            'top_venues': top_venues(self.venues),
+            'h_index': index_summary(self.h_index.values()),
+            'i10_index': index_summary(self.i10_index.values())
+        }
+
+def top_venues(venues):
+    # Aggregates stored before placeholders were dropped may still count them
+    venues = collections.Counter({venue: count for venue, count in venues.items()
+                                  if count > 0 and venue.strip() not in PLACEHOLDER_VENUES})
+    return [{'venue': venue, 'publications': count} for venue, count in venues.most_common(ANALYTICS_TOP_VENUES)]
+
+# Background upload jobs
+JOB_FINISHED_STATUSES = ('done', 'not_found', 'error')
+jobs = OrderedDict()  # job id -> Job, oldest first
+_jobs_lock = threading.Lock()
+_job_semaphore = None
+
+class JobStore:
+    """Durable checkpoints for bulk jobs in SQLite
+
+    Keeps each job's roster, every faculty's status, attempt count and last
+    error, and the result of each finished faculty, so a job interrupted by a
+    restart or by Scholar blocking can be resumed without repeating finished
+    work. Faculty whose last attempt failed form the job's retry queue.
+
+    For jobs with runner 'queue' it is also the work queue: workers claim
+    pending faculty under a lease (see claim()), and whichever worker finishes
+    a job's last faculty marks it completed. Other brokers can stand in by
+    providing claim(), release(), update_faculty() and complete_jobs().
+    """
+
+    def __init__(self, path=JOBS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, error TEXT, created_at REAL NOT NULL, finished_at REAL, "
+            "runner TEXT NOT NULL DEFAULT 'inline', roster_open INTEGER NOT NULL DEFAULT 0, roster_owner TEXT, "
+            "roster_until REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_faculty ("
+            "job_id TEXT NOT NULL, idx INTEGER NOT NULL, name TEXT NOT NULL, institution TEXT, scholar_id TEXT, "
+            "status TEXT NOT NULL, attempts INTEGER NOT NULL, error TEXT, publications INTEGER NOT NULL, result BLOB, "
+            "aggregates TEXT, lease_owner TEXT, lease_until REAL, PRIMARY KEY (job_id, idx))"
+        )
+        # Stores created by earlier versions
+        self._add_missing_columns('jobs', {
+            'runner': "TEXT NOT NULL DEFAULT 'inline'", 'roster_open': "INTEGER NOT NULL DEFAULT 0",
+            'roster_owner': 'TEXT', 'roster_until': 'REAL'
+        })
+        self._add_missing_columns('job_faculty', {'aggregates': 'TEXT', 'lease_owner': 'TEXT', 'lease_until': 'REAL'})
+        self._conn.execute("CREATE INDEX IF NOT EXISTS job_faculty_status ON job_faculty (status, job_id)")
+
+    def _add_missing_columns(self, table, columns):
+        existing = [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+        for column, definition in columns.items():
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def create(self, job, roster_owner=None):
+        """Checkpoint a new job; roster_owner is the process reading its roster, if it is still being read"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT INTO jobs (id, status, error, created_at, finished_at, runner, roster_open, roster_owner, "
+                    "roster_until) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job.id, job.status, job.error, job.created_at, job.finished_at, job.runner,
+                     int(roster_owner is not None), roster_owner,
+                     time.time() + ROSTER_LEASE_SECONDS if roster_owner is not None else None)
+                )
+                self._insert_faculty(job.id, job.faculty, job.faculty_list)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def add_faculty(self, job_id, entries, faculty_list):
+        """Checkpoint faculty appended to a job whose roster is still being read"""
+        with self._lock:
+            self._insert_faculty(job_id, entries, faculty_list)
+
+    def _insert_faculty(self, job_id, entries, faculty_list):
+        self._conn.executemany(
+            "INSERT INTO job_faculty (job_id, idx, name, institution, scholar_id, status, attempts, error, publications) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(job_id, entry['index'], entry['name'], entry['institution'], faculty.get('scholar_id'),
+              entry['status'], entry['attempts'], entry['error'], entry['publications'])
+             for entry, faculty in zip(entries, faculty_list)]
+        )
+
+    def set_status(self, job):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (job.status, job.error, job.finished_at, job.id)
+            )
+
+    def close_roster(self, job_id):
+        """Mark a streamed roster fully read, so the job can complete once its faculty are done"""
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET roster_open = 0, roster_until = NULL WHERE id = ?", (job_id,))
+
+    def renew_roster(self, job_id, owner, lease=ROSTER_LEASE_SECONDS):
+        """Record that owner is still reading the job's roster, returning whether the roster is still open"""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE jobs SET roster_until = ? WHERE id = ? AND roster_open = 1 AND roster_owner = ?",
+                (time.time() + lease, job_id, owner)
+            ).rowcount > 0
+
+    def set_faculty_status(self, job_id, indices, status):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE job_faculty SET status = ? WHERE job_id = ? AND idx = ?",
+                [(status, job_id, index) for index in indices]
+            )
+
+    def claim(self, worker_id, limit, lease=JOB_LEASE_SECONDS):
+        """Lease up to limit pending faculty of queued jobs to a worker, oldest job first
+
+        Faculty whose lease ran out (their worker died) are claimed again.
+        Returns dicts with the job id and the faculty's progress entry.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT f.job_id, f.idx, f.name, f.institution, f.scholar_id, f.attempts FROM job_faculty f "
+                    "JOIN jobs j ON j.id = f.job_id WHERE j.runner = 'queue' AND j.status IN ('queued', 'running') "
+                    "AND (f.status = 'pending' OR (f.status = 'running' AND f.lease_until < ?)) "
+                    "ORDER BY j.created_at, f.idx LIMIT ?", (now, limit)
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE job_faculty SET status = 'running', attempts = attempts + 1, lease_owner = ?, lease_until = ? "
+                    "WHERE job_id = ? AND idx = ?",
+                    [(worker_id, now + lease, job_id, index) for job_id, index, *_ in rows]
+                )
+                self._conn.executemany(
+                    "UPDATE jobs SET status = 'running' WHERE id = ? AND status = 'queued'",
+                    [(job_id,) for job_id in {row[0] for row in rows}]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [
+            {'job_id': job_id,
+             'faculty': {'name': name, 'institution': institution, 'scholar_id': scholar_id},
+             'entry': {'index': index, 'name': name, 'institution': institution, 'status': 'running',
+                       'publications': 0, 'attempts': attempts + 1, 'error': None}}
+            for job_id, index, name, institution, scholar_id, attempts in rows
+        ]
+
+    def renew(self, worker_id, claims, lease=JOB_LEASE_SECONDS):
+        """Extend a worker's leases on the given claims, returning how many it still held"""
+        lease_until = time.time() + lease
+        with self._lock:
+            return self._conn.executemany(
+                "UPDATE job_faculty SET lease_until = ? WHERE job_id = ? AND idx = ? AND lease_owner = ? AND status = 'running'",
+                [(lease_until, claim['job_id'], claim['entry']['index'], worker_id) for claim in claims]
+            ).rowcount
+
+    def release(self, worker_id):
+        """Return a stopping worker's unfinished faculty to the queue, returning how many"""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE job_faculty SET status = 'pending', lease_owner = NULL, lease_until = NULL "
+                "WHERE status = 'running' AND lease_owner = ?", (worker_id,)
+            ).rowcount
+
+    def complete_jobs(self):
+        """Mark queued jobs with no faculty left to process completed, returning their ids
+
+        Rosters whose reader stopped checking in (its process died) are closed
+        first, keeping the faculty read so far, so their jobs can complete too.
+        """
+        now = time.time()
+        with self._lock:
+            abandoned = self._conn.execute(
+                "UPDATE jobs SET roster_open = 0, roster_until = NULL WHERE runner = 'queue' AND roster_open = 1 "
+                "AND roster_until < ? RETURNING id, roster_owner", (now,)
+            ).fetchall()
+            rows = self._conn.execute(
+                "UPDATE jobs SET status = 'completed', finished_at = ? WHERE runner = 'queue' "
+                "AND status IN ('queued', 'running') AND roster_open = 0 AND NOT EXISTS ("
+                "SELECT 1 FROM job_faculty f WHERE f.job_id = jobs.id AND f.status IN ('pending', 'running')) "
+                "RETURNING id", (now,)
+            ).fetchall()
+        for job_id, owner in abandoned:
+            logger.warning(f"Closed the roster of job {job_id}: its reader {owner} stopped; unread rows are lost")
+        return [row[0] for row in rows]
+
+    def update_faculty(self, job_id, entry, result=None, aggregates=None, lease_owner=None):
+        """Checkpoint one faculty's progress, with its process_faculty_async() result and aggregates once done
+
+        With lease_owner, the update only applies while that worker still holds
+        the faculty's lease. Returns whether it was applied.
+        """
+        blob = None
+        if result is not None:
+            blob = zlib.compress(json.dumps({
+                'profile': result['profile'],
+                'publications': encode_publications(result['publications'])
+            }, separators=(',', ':')).encode('utf-8'))
+        aggregates = json.dumps(aggregates, separators=(',', ':')) if aggregates is not None else None
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE job_faculty SET status = ?, attempts = ?, error = ?, publications = ?, result = COALESCE(?, result), "
+                "aggregates = COALESCE(?, aggregates), lease_owner = NULL, lease_until = NULL WHERE job_id = ? AND idx = ? "
+                "AND (? IS NULL OR lease_owner = ?)",
+                (entry['status'], entry['attempts'], entry['error'], entry['publications'], blob, aggregates,
+                 job_id, entry['index'], lease_owner, lease_owner)
+            ).rowcount > 0
+
+    def load(self, job_id):
+        """The stored job row and its faculty rows, or None for an unknown job"""
+        with self._lock:
+            job_row = self._conn.execute(
+                "SELECT id, status, error, created_at, finished_at, runner FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job_row is None:
+                return None
+            faculty_rows = self._conn.execute(
+                "SELECT idx, name, institution, scholar_id, status, attempts, error, publications, aggregates FROM job_faculty "
+                "WHERE job_id = ? ORDER BY idx", (job_id,)
+            ).fetchall()
+        columns = ('index', 'name', 'institution', 'scholar_id', 'status', 'attempts', 'error', 'publications', 'aggregates')
+        faculty_rows = [dict(zip(columns, row)) for row in faculty_rows]
+        for row in faculty_rows:
+            row['aggregates'] = json.loads(row['aggregates']) if row['aggregates'] else None
+        return dict(zip(('id', 'status', 'error', 'created_at', 'finished_at', 'runner'), job_row)), faculty_rows
+
+    def load_results(self, job_id, indices=None):
+        """Results of the job's finished faculty (or those at indices) in roster order, as process_faculty_async() returns them"""
+        return list(self.load_result_map(job_id, indices).values())
+
+    def load_result_map(self, job_id, indices=None):
+        """{faculty index: result} for the job's finished faculty, or only those at indices, in roster order"""
+        query = "SELECT idx, result FROM job_faculty WHERE job_id = ? AND status = 'done' AND result IS NOT NULL"
+        with self._lock:
+            if indices is None:
+                rows = self._conn.execute(query + " ORDER BY idx", (job_id,)).fetchall()
+            else:
+                indices = sorted(set(indices))
+                rows = []
+                # Stay well under SQLite's bound parameter limit
+                for start in range(0, len(indices), 500):
+                    batch = indices[start:start + 500]
+                    rows.extend(self._conn.execute(
+                        query + f" AND idx IN ({','.join('?' * len(batch))}) ORDER BY idx", (job_id, *batch)
+                    ).fetchall())
+        results = {}
+        for index, blob in rows:
+            data = json.loads(zlib.decompress(blob))
+            results[index] = {'profile': data['profile'], 'publications': decode_publications(data['publications'])}
+        return results
+
+# Shared job checkpoint store
+job_store = JobStore()
+
+class Job:
+    """A bulk upload processed in the background, with per-faculty progress and results
+
+    Progress is checkpointed to job_store as it happens; see Job.restore().
+    A job started on a roster that is still being read (see submit_roster_job())
+    grows through add_faculty(), and reports the reader's stats as `roster`.
+    Jobs run by workers (runner 'queue') are live: the API process only reads
+    their progress back from job_store; see refresh().
+    """
+
+    def __init__(self, faculty_list, job_id=None, runner=JOB_RUNNER):
+        self.id = job_id or uuid.uuid4().hex
+        self.runner = runner
+        self._refreshed_at = 0.0
+        self.status = 'queued'
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.faculty_list = faculty_list
+        self.faculty = self._new_entries(faculty_list)
+        self.roster = None  # RosterReader.stats() plus 'reading', for streamed rosters
+        self.aggregates = {}  # faculty index -> faculty_aggregates() of finished faculty
+        self.department = DepartmentAggregates()
+        # Indices of faculty with results, in completion order; the results themselves stay in job_store
+        self.finished = []
+        self.events = []  # Faculty completion events for streaming clients, without results - see result_records()
+        self._condition = threading.Condition()
+
+    @classmethod
+    def restore(cls, job_id):
+        """Rebuild a job from its checkpoints, e.g. after a restart, or None if unknown"""
+        stored = job_store.load(job_id)
+        if stored is None:
+            return None
+        job_row, faculty_rows = stored
+        
+        job = cls([{'name': row['name'], 'institution': row['institution'], 'scholar_id': row['scholar_id']}
+                   for row in faculty_rows], job_id, job_row['runner'])
+        job.created_at = job_row['created_at']
+        job.finished_at = job_row['finished_at']
+        job.error = job_row['error']
+        job._refreshed_at = time.monotonic()
+        # A job that was queued or running when the server stopped can only be resumed,
+        # unless workers are running it
+        job.status = job_row['status'] if job.live or job_row['status'] in ('completed', 'failed') else 'interrupted'
+        for entry, row in zip(job.faculty, faculty_rows):
+            entry.update(status='pending' if row['status'] == 'running' and not job.live else row['status'],
+                         attempts=row['attempts'], error=row['error'], publications=row['publications'])
+            if row['aggregates'] is not None:
+                job.aggregates[entry['index']] = row['aggregates']
+                job.department.add(entry['index'], row['aggregates'])
+        job.finished = [row['index'] for row in faculty_rows if row['status'] == 'done']
+        return job
+
+    def _new_entries(self, faculty_list, start=0):
+        return [
+            {'index': index, 'name': faculty['name'], 'institution': faculty['institution'],
+             'status': 'pending', 'publications': 0, 'attempts': 0, 'error': None}
+            for index, faculty in enumerate(faculty_list, start=start)
+        ]
+
+    @property
+    def done(self):
+        return self.status in ('completed', 'failed', 'interrupted')
+
+    @property
+    def live(self):
+        return self.runner == 'queue'
+
+    def refresh(self):
+        """Pull in progress that workers checkpointed since the last refresh, at most every JOB_REFRESH_INTERVAL"""
+        if not self.live or time.monotonic() - self._refreshed_at < JOB_REFRESH_INTERVAL:
+            return
+        self._refreshed_at = time.monotonic()
+        stored = job_store.load(self.id)
+        if stored is None:
+            return
+        job_row, faculty_rows = stored
+        
+        with self._condition:
+            known = {entry['index']: (entry['status'], entry['attempts']) for entry in self.faculty}
+        finished = [row for row in faculty_rows if row['status'] in JOB_FINISHED_STATUSES
+                    and known.get(row['index']) != (row['status'], row['attempts'])]
+        
+        with self._condition:
+            self.status, self.error, self.finished_at = job_row['status'], job_row['error'], job_row['finished_at']
+            for row in faculty_rows[len(self.faculty):]:
+                # Rows added by a roster read in another process
+                self.faculty_list.append({'name': row['name'], 'institution': row['institution'],
+                                          'scholar_id': row['scholar_id']})
+                self.faculty.extend(self._new_entries(self.faculty_list[-1:], row['index']))
+            for row in faculty_rows:
+                self.faculty[row['index']].update(status=row['status'], attempts=row['attempts'],
+                                                  error=row['error'], publications=row['publications'])
+            for row in finished:
+                index = row['index']
+                if row['aggregates'] is not None:
+                    if index in self.aggregates:
+                        self.department.remove(index, self.aggregates[index])
+                    self.aggregates[index] = row['aggregates']
+                    self.department.add(index, row['aggregates'])
+                if row['status'] == 'done':
+                    self.finished.append(index)
+                self.events.append({'type': 'faculty', **self.faculty[index]})
+            self._condition.notify_all()
+
+    def add_faculty(self, faculty_list):
+        """Append and checkpoint faculty read from a streamed roster, returning their indices"""
+        with self._condition:
+            start = len(self.faculty)
+            entries = self._new_entries(faculty_list, start)
+            job_store.add_faculty(self.id, entries, faculty_list)
+            self.faculty_list.extend(faculty_list)
+            self.faculty.extend(entries)
+            self._condition.notify_all()
+        return list(range(start, start + len(entries)))
+
+    def update_roster(self, stats, reading=True, error=None):
+        with self._condition:
+            self.roster = {**stats, 'reading': reading, 'error': str(error) if error is not None else None}
+            self._condition.notify_all()
+
+    def start(self):
+        with self._condition:
+            self.status = 'running'
+            job_store.set_status(self)
+            self._condition.notify_all()
+
+    async def update_async(self, index, status, result=None, error=None):
+        """Record and checkpoint a faculty's progress; finished faculty are published to streams
+
+        The checkpoint is written in the executor, off the fetch engine's loop,
+        and before the progress is published, so streams only announce results
+        job_store already holds.
+        """
+        with self._condition:
+            entry = dict(self.faculty[index], status=status, error=str(error) if error is not None else None)
+        if status == 'running':
+            entry['attempts'] += 1
+        if result is not None:
+            entry['publications'] = len(result['publications'])
+        aggregates = await asyncio.get_running_loop().run_in_executor(None, self._checkpoint, entry, result)
+        
+        with self._condition:
+            self.faculty[index].update(entry)
+            if aggregates is not None:
+                if index in self.aggregates:
+                    self.department.remove(index, self.aggregates[index])
+                self.aggregates[index] = aggregates
+                self.department.add(index, aggregates)
+                self.finished.append(index)
+            if status in JOB_FINISHED_STATUSES:
+                self.events.append({'type': 'faculty', **self.faculty[index]})
+            self._condition.notify_all()
+
+    def _checkpoint(self, entry, result):
+        """Save a faculty's progress entry and result to job_store, returning the result's aggregates"""
+        aggregates = faculty_aggregates(result) if result is not None else None
+        job_store.update_faculty(self.id, entry, result, aggregates)
+        return aggregates
+
+    def unfinished_indices(self, retry_failed=True):
+        """Faculty still to process: never finished, plus the retry queue when retry_failed is set"""
+        statuses = ('pending', 'running', 'error') if retry_failed else ('pending', 'running')
+        return [entry['index'] for entry in self.faculty if entry['status'] in statuses]
+
+    def requeue(self, indices):
+        """Queue the given faculty for another run of this job"""
+        with self._condition:
+            for index in indices:
+                self.faculty[index]['status'] = 'pending'
+            self.status = 'queued'
+            self.error = None
+            self.finished_at = None
+            job_store.set_faculty_status(self.id, indices, 'pending')
+            job_store.set_status(self)
+            self._condition.notify_all()
+
+    def finish(self, status, error=None):
+        with self._condition:
+            self.status = status
+            self.error = str(error) if error is not None else None
+            self.finished_at = time.time()
+            job_store.set_status(self)
+            self._condition.notify_all()
+
+    def wait_for_events(self, offset, timeout):
+        """Block until there are events past offset or the job is done; returns (events, done)"""
+        if self.live:
+            # Workers in other processes can't notify us; poll their checkpoints instead
+            deadline = time.monotonic() + timeout
+            while True:
+                self.refresh()
+                with self._condition:
+                    if len(self.events) > offset or self.done or time.monotonic() >= deadline:
+                        return self.events[offset:], self.done
+                time.sleep(max(0.0, min(JOB_REFRESH_INTERVAL, deadline - time.monotonic())))
+        with self._condition:
+            self._condition.wait_for(lambda: len(self.events) > offset or self.done, timeout)
+            return self.events[offset:], self.done
+
+    def progress(self):
+        counts = {status: 0 for status in ('pending', 'running') + JOB_FINISHED_STATUSES}
+        for entry in self.faculty:
+            counts[entry['status']] += 1
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'error': self.error,
+            'total': len(self.faculty),
+            'completed': sum(counts[status] for status in JOB_FINISHED_STATUSES),
+            'counts': counts,
+            'resumable': self.done and bool(self.unfinished_indices()),
+            'roster': self.roster
+        }
+
+    def analytics(self):
+        """Precomputed per-faculty and job-wide aggregates, without publication rows"""
+        with self._condition:
+            return {
+                'job_id': self.id,
+                'status': self.status,
+                'total': len(self.faculty),
+                'department': self.department.summary(),
+                'faculty': [
+                    {'index': index, **{key: value for key, value in aggregates.items() if key != 'venues'},
+                     'top_venues': top_venues(aggregates['venues'])}
+                    for index, aggregates in sorted(self.aggregates.items())
+                ]
+            }
+
+    def result_records(self, indices):
+        """{index: faculty_result_records()} for finished faculty at indices, loaded from job_store"""
+        return {index: faculty_result_records(result)
+                for index, result in job_store.load_result_map(self.id, indices).items()}
+
+    def with_results(self, events):
+        """Faculty events as streamed, each with its faculty's result records (None unless done)"""
+        records = self.result_records([event['index'] for event in events if event['status'] == 'done'])
+        return [{**event, 'result': records.get(event['index'])} for event in events]
+
+    def snapshot(self, since=0):
+        """Progress, per-faculty status and the results finished after the first `since`"""
+        with self._condition:
+            snapshot = {
+                **self.progress(),
+                'faculty': [dict(entry) for entry in self.faculty],
+                'retry_queue': [dict(entry) for entry in self.faculty if entry['status'] == 'error'],
+                'next': len(self.finished)
+            }
+            indices = self.finished[since:]
+        records = self.result_records(indices)
+        snapshot['results'] = [records[index] for index in indices if index in records]
+        return snapshot
+
+async def run_job_async(job, indices=None, chunks=None):
+    """Process a job's faculty (or only those at indices) once one of the MAX_CONCURRENT_JOBS slots frees up
+
+    chunks is a queue fed by feed_roster() for a job whose roster is still being read.
+    """
+    global _job_semaphore
+    if _job_semaphore is None:
+        _job_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    
+    async with _job_semaphore:
+        job.start()
+        try:
+            results = await process_faculty_list_async(job.faculty_list, job, indices, chunks)
+            if indices is not None:
+                # A resumed job's download includes faculty finished in earlier runs
+                results = job_store.load_results(job.id)
+            # The job id doubles as the result id for /download
+            result_store.put(job.id, build_bulk_results_frame(results))
+            job.finish('completed')
+            logger.info(f"Job {job.id} completed: {len(results)}/{len(job.faculty)} faculty found")
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.finish('failed', e)
+
+def track_job(job):
+    """Keep a job available for polling, dropping the oldest finished jobs beyond MAX_JOBS from memory"""
+    with _jobs_lock:
+        jobs[job.id] = job
+        for job_id in [job_id for job_id, old_job in jobs.items() if old_job.done][:max(0, len(jobs) - MAX_JOBS)]:
+            del jobs[job_id]
+
+def get_job(job_id):
+    """Look up a job in memory, falling back to its checkpoints"""
+    job = jobs.get(job_id)
+    if job is None and re.fullmatch(r'[0-9a-f]{32}', job_id):
+        job = Job.restore(job_id)
+        if job is not None:
+            track_job(job)
+    if job is not None:
+        job.refresh()
+    return job
+
+def job_results_frame(job_id):
+    """A job's bulk results frame, rebuilt from its checkpoints for jobs from earlier sessions or still running"""
+    df = result_store.get(job_id)
+    if df is None:
+        job_results = job_store.load_results(job_id)
+        if job_results:
+            df = build_bulk_results_frame(job_results)
+    return df
+
+def submit_roster_job(roster):
+    """Start a bulk job on a roster while it is still being read, returning (job, error)
+
+    The first ROSTER_CHUNK_SIZE faculty are read before returning, so the job
+    has work straight away; a background thread reads the rest and hands it
+    to the job chunk by chunk, or just adds it to the work queue when workers
+    run the job. Rows left unread if the server stops are not recovered: an
+    in-process job is interrupted and can be resumed for the faculty read so
+    far, and a queued job's roster is closed once the reader misses its
+    check-ins for ROSTER_LEASE_SECONDS (see JobStore.complete_jobs()), so
+    workers complete the job with the faculty read so far.
+    """
+    chunks = roster.chunks(ROSTER_CHUNK_SIZE)
+    try:
+        first_chunk = next(chunks, [])
+    except Exception as e:
+        roster.close()
+        logger.error(f"Error reading roster file: {e}")
+        return None, f"Error processing roster file: {e}"
+    if not first_chunk:
+        roster.close()
+        return None, "No valid faculty rows found in the uploaded file"
+    
+    job = Job([])
+    job.update_roster(roster.stats())
+    job_store.create(job, roster_owner=instance_id())
+    job.add_faculty(first_chunk)
+    track_job(job)
+    
+    queue = None
+    if not job.live:
+        loop = get_engine_loop()
+        queue = run_async(_new_chunk_queue())
+        asyncio.run_coroutine_threadsafe(queue.put(list(range(len(first_chunk)))), loop).result()
+        asyncio.run_coroutine_threadsafe(run_job_async(job, chunks=queue), loop)
+    threading.Thread(target=feed_roster, args=(job, roster, chunks, queue),
+                     name=f"roster-{job.id[:8]}", daemon=True).start()
+    return job, None
+
+async def _new_chunk_queue():
+    # Holds one chunk, so the reader blocks until the job takes it
+    return asyncio.Queue(maxsize=1)
+
+def feed_roster(job, roster, chunks, queue=None):
+    """Read the rest of a roster into job, passing each chunk's indices to its queue when it runs in-process
+
+    Reading stops early if the job stops taking chunks (it failed), or if its
+    roster was closed because this reader missed its check-ins, so the
+    spooled roster is still closed and removed.
+    """
+    error = None
+    owner = instance_id()
+    renewed_at = time.monotonic()
+    try:
+        with roster:
+            for chunk in chunks:
+                if time.monotonic() - renewed_at >= ROSTER_LEASE_RENEW_INTERVAL:
+                    renewed_at = time.monotonic()
+                    if not job_store.renew_roster(job.id, owner):
+                        logger.warning(f"Job {job.id} closed its roster before it was read; {len(job.faculty)} faculty were added")
+                        break
+                indices = job.add_faculty(chunk)
+                if queue is not None and not put_chunk(job, queue, indices):
+                    logger.warning(f"Job {job.id} stopped before its roster was read; {len(job.faculty)} faculty were added")
+                    break
+                job.update_roster(roster.stats())
+    except Exception as e:
+        logger.error(f"Error reading roster for job {job.id}: {e}")
+        error = e
+    finally:
+        roster.log_summary()
+        job.update_roster(roster.stats(), reading=False, error=error)
+        job_store.close_roster(job.id)
+        if queue is not None:
+            put_chunk(job, queue, None)
+
+def put_chunk(job, queue, indices):
+    """Hand indices to a job's chunk queue from another thread, returning False if the job finished first"""
+    loop = get_engine_loop()
+    while not job.done:
+        try:
+            asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(queue.put(indices), ROSTER_FEED_CHECK_INTERVAL), loop
+            ).result()
+            return True
+        except TimeoutError:
+            continue
+    return False
+
+def resume_job(job, retry_failed=True):
+    """Queue a finished or interrupted job again for its unfinished faculty; returns how many were queued"""
+    indices = job.unfinished_indices(retry_failed)
+    if indices:
+        logger.info(f"Resuming job {job.id} for {len(indices)} unfinished faculty")
+        job.requeue(indices)
+        if not job.live:
+            asyncio.run_coroutine_threadsafe(run_job_async(job, indices), get_engine_loop())
+    return len(indices)
+
+# Scrape workers
+def instance_id():
+    """Identifies this process to others sharing JOBS_PATH, as host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+async def process_claimed_faculty_async(claim, worker_id):
+    """Process one faculty claimed from the work queue and checkpoint the outcome, if worker_id still holds the lease"""
+    entry = claim['entry']
+    try:
+        faculty_result, error = await process_faculty_async(claim['faculty']), None
+    except Exception as e:
+        faculty_result, error = None, e
+    await record_faculty_outcome_async(None, entry['index'], claim['faculty'], faculty_result, error)
+    
+    entry['status'] = 'error' if error else 'done' if faculty_result else 'not_found'
+    entry['error'] = str(error) if error is not None else None
+    entry['publications'] = len(faculty_result['publications']) if faculty_result else 0
+    applied = await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+        job_store.update_faculty, claim['job_id'], entry, faculty_result,
+        faculty_aggregates(faculty_result) if faculty_result else None, lease_owner=worker_id
+    ))
+    if not applied:
+        logger.warning(f"Lease on {claim['faculty']['name']} in job {claim['job_id']} was lost; discarding this worker's result")
+
+async def run_worker_async(worker_id):
+    """Keep up to MAX_CONCURRENT_FACULTY claimed faculty in progress, completing jobs as they drain
+
+    Leases on in-flight faculty are renewed every JOB_LEASE_RENEW_INTERVAL, so
+    slow faculty (e.g. under a shared or throttled budget) aren't reclaimed.
+    """
+    request_priority.set(PRIORITY_BULK)
+    loop = asyncio.get_running_loop()
+    in_flight = {}  # Task -> claim
+    renewed_at = time.monotonic()
+    try:
+        while True:
+            free = MAX_CONCURRENT_FACULTY - len(in_flight)
+            claimed = await loop.run_in_executor(None, job_store.claim, worker_id, free) if free else []
+            for claim in claimed:
+                in_flight[asyncio.ensure_future(process_claimed_faculty_async(claim, worker_id))] = claim
+            
+            if in_flight:
+                done, _ = await asyncio.wait(in_flight, timeout=WORKER_POLL_INTERVAL, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del in_flight[task]
+            else:
+                await asyncio.sleep(WORKER_POLL_INTERVAL)
+            
+            if in_flight and time.monotonic() - renewed_at >= JOB_LEASE_RENEW_INTERVAL:
+                renewed_at = time.monotonic()
+                await loop.run_in_executor(None, job_store.renew, worker_id, list(in_flight.values()))
+            
+            for job_id in await loop.run_in_executor(None, job_store.complete_jobs):
+                logger.info(f"Job {job_id} completed")
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+def run_worker():
+    """Run this process as a scrape worker until interrupted
+
+    Workers claim faculty of jobs submitted with JOB_RUNNER=queue from
+    JOBS_PATH, share the result cache (CACHE_BACKEND=sqlite) and the request
+    budget (RATE_BUDGET_PATH) with every other process on the host, and hand
+    their unfinished claims back when stopped by Ctrl-C or SIGTERM.
+    """
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, stop)
+    
+    worker_id = instance_id()
+    logger.info(f"Worker {worker_id} processing queued jobs from {JOBS_PATH}")
+    future = asyncio.run_coroutine_threadsafe(run_worker_async(worker_id), get_engine_loop())
+    try:
+        future.result()
+    except KeyboardInterrupt:
+        logger.info(f"Worker {worker_id} stopping")
+    finally:
+        future.cancel()
+        released = job_store.release(worker_id)
+        if released:
+            logger.info(f"Returned {released} unfinished faculty to the queue")
+
+# Streaming export
+def iter_export_chunks(df):
+    """Yield EXPORT_CHUNK_ROWS-row slices of df with missing values as None, and missing years as "N/A\""""
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        if 'Year' in chunk:
+            chunk['Year'] = chunk['Year'].where(chunk['Year'].notna(), "N/A")
+        yield chunk
+
+def generate_csv(df):
+    """Stream df as CSV text"""
+    yield df.iloc[:0].to_csv(index=False)  # Header row
+    for chunk in iter_export_chunks(df):
+        yield chunk.to_csv(index=False, header=False)
+
+def generate_json(df, lines=False):
+    """Stream df as a JSON array of records, or as NDJSON when lines is set"""
+    if not lines:
+        yield '['
+    separator = ''
+    for chunk in iter_export_chunks(df):
+        records = chunk.to_dict(orient="records")
+        if lines:
+            yield ''.join(json.dumps(record) + '\n' for record in records)
+        else:
+            yield separator + ','.join(json.dumps(record) for record in records)
+            separator = ','
+    if not lines:
+        yield ']'
+
+def gzip_stream(chunks):
+    """Gzip a stream of text chunks on the fly"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 writes a gzip header
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+def stream_file_and_remove(path, block_size=64 * 1024):
+    """Stream a temporary file's contents, deleting it once the response is done"""
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+                yield block
+    finally:
+        os.remove(path)
+
+def write_xlsx(df, path):
+    """Write df to an XLSX file row by row using xlsxwriter's constant_memory mode"""
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    worksheet = workbook.add_worksheet("Publications")
+    
+    # Same header style pandas' to_excel uses
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+    
+    row = 1
+    for chunk in iter_export_chunks(df):
+        for values in chunk.itertuples(index=False, name=None):
+            worksheet.write_row(row, 0, values)
+            row += 1
+    
+    workbook.close()
+
+# API routes - registered on the Flask app by create_app()
+api = Blueprint('api', __name__)
+
+@api.route("/", methods=["GET", "POST"])
+def index():
     if request.method == "POST":
         # Check if this is an API request looking for JSON (from Next.js)
         want_json = request.headers.get('Accept', '').find('application/json') != -1
@@ -493,42 +3367,41 @@ def index():
         if 'file' in request.files and request.files['file'].filename:
             file = request.files['file']
             
+            # API clients get a background job to poll or stream instead of waiting;
+            # it starts on the first rows while the rest of the roster is read
+            if want_json:
+                roster, error = open_roster(file)
+                if not error:
+                    job, error = submit_roster_job(roster)
+                if error:
+                    return jsonify({"error": error}), 400
+                
+                return jsonify({
+                    "job_id": job.id,
+                    "status": job.status,
+                    "total": len(job.faculty),
+                    "status_url": f"/jobs/{job.id}",
+                    "stream_url": f"/jobs/{job.id}/stream"
+                }), 202
+            
             # Process Excel file
             results, error = process_excel_file(file)
             
             if error:
-                if want_json:
-                    return jsonify({"error": error}), 400
                 return f"Error: {error}"
             
             if results:
                 # Store combined publication data for download
-                all_pubs = []
-                for faculty in results:
-                    # Add faculty name and institution to each publication
-                    for pub in faculty.get('publications', []):
-                        pub['Faculty'] = faculty['profile']['name']
-                        pub['Faculty_Institution'] = faculty['profile']['affiliation']
-                    
-                    all_pubs.extend(faculty.get('publications', []))
-                
-                if all_pubs:
-                    processed_data = pd.DataFrame(all_pubs)
-                else:
-                    processed_data = pd.DataFrame(columns=['Title', 'Year', 'Type', 'Venue', 'Authors', 'Faculty', 'Faculty_Institution'])
-                
-                # Return JSON format for Next.js
-                if want_json:
-                    return jsonify({"faculty_results": results})
+                result_id = ResultStore.new_id()
+                result_store.put(result_id, build_bulk_results_frame(results))
                 
-                # Or render template for direct browser access
+                # Render template for direct browser access
                 return render_template(
                     "index.html", 
-                    faculty_results=results
+                    faculty_results=[faculty_result_records(result) for result in results],
+                    result_id=result_id
                 )
             else:
-                if want_json:
-                    return jsonify({"error": "No data found for any faculty in the uploaded file."}), 404
                 return "No data found for any faculty in the uploaded file."
         
         else:
@@ -537,32 +3410,61 @@ def index():
                 data = request.get_json()
                 name = data.get("name")
                 institution = data.get("institution")
+                mode = data.get("mode")
             else:
                 name = request.form.get("name")
                 institution = request.form.get("institution")
+                mode = request.form.get("mode")
             
             if not name:
                 if want_json:
                     return jsonify({"error": "Please enter a faculty name."}), 400
                 return "Please enter a faculty name."
             
-            profile, df = get_faculty_publications(name, institution)
+            # Profile-only mode answers as soon as the profile is known; the client
+            # then pages through publications via /authors/<id>/publications
+            if want_json and mode == "profile":
+                try:
+                    profile = get_faculty_profile(name, institution)
+                except Exception as e:
+                    logger.error(f"Error fetching profile for {name}: {e}")
+                    return jsonify({"error": "Could not reach Google Scholar. Please try again."}), 502
+                if not profile:
+                    return jsonify({"error": "No data found for the given professor. Please check the name and institution."}), 404
+                return jsonify({
+                    "profile": profile,
+                    "publications_url": f"/authors/{profile['id']}/publications"
+                })
+            
+            try:
+                profile, df = get_faculty_publications(name, institution)
+            except Exception as e:
+                logger.error(f"Error in get_faculty_publications: {e}")
+                if want_json:
+                    return jsonify({"error": "Could not reach Google Scholar. Please try again."}), 502
+                return "Could not reach Google Scholar. Please try again."
             
             if profile:
-                processed_data = df if df is not None and not df.empty else pd.DataFrame()
+                # Keep this search's publications downloadable under its own id
+                result_id = None
+                if df is not None and not df.empty:
+                    result_id = ResultStore.new_id()
+                    result_store.put(result_id, df)
                 
                 # Return JSON for API requests
                 if want_json:
                     return jsonify({
                         "profile": profile,
-                        "results": df.to_dict(orient="records") if not df.empty else []
+                        "results": publication_records(df),
+                        "result_id": result_id
                     })
                 
                 # Or render template for direct browser access
                 return render_template(
                     "results.html", 
                     profile=profile, 
-                    results=df.to_dict(orient="records") if not df.empty else []
+                    results=publication_records(df),
+                    result_id=result_id
                 )
             else:
                 if want_json:
@@ -574,46 +3476,253 @@ def index():
         return jsonify({"message": "Use POST method to search for publications"})
     return render_template("index.html")
 
-@app.route("/download")
+@api.route("/authors/<author_id>/publications")
+def author_publications(author_id):
+    """One page of an author's publications, newest first, for lazy loading after a profile-only search"""
+    if not parse_scholar_id(author_id):
+        return jsonify({"error": "Invalid author id"}), 400
+    
+    page = request.args.get('page', 0, type=int)
+    if page < 0:
+        return jsonify({"error": "Page must not be negative"}), 400
+    
+    try:
+        publications, has_more = run_async(get_publications_page_async(author_id, page))
+    except Exception as e:
+        logger.error(f"Error fetching publications page {page} for author {author_id}: {e}")
+        return jsonify({"error": "Could not fetch publications. Please try again."}), 502
+    
+    return jsonify({
+        "author_id": author_id,
+        "page": page,
+        "page_size": PUBLICATIONS_PAGE_SIZE,
+        "publications": publications,
+        "has_more": has_more
+    })
+
+@api.route("/jobs/<job_id>")
+def job_status(job_id):
+    """Report a job's progress plus results finished since the `since` offset"""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    
+    since = request.args.get('since', 0, type=int)
+    return jsonify(job.snapshot(since))
+
+@api.route("/jobs/<job_id>/stream")
+def job_stream(job_id):
+    """Stream finished faculty as NDJSON, or as Server-Sent Events when requested"""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    
+    use_sse = 'text/event-stream' in request.headers.get('Accept', '')
+    
+    def format_event(event):
+        payload = json.dumps(event)
+        return f"event: {event['type']}\ndata: {payload}\n\n" if use_sse else payload + "\n"
+    
+    def generate():
+        offset = 0
+        while True:
+            events, done = job.wait_for_events(offset, JOB_STREAM_HEARTBEAT)
+            for event in job.with_results(events):
+                yield format_event(event)
+            offset += len(events)
+            
+            if done and len(job.events) == offset:
+                yield format_event({'type': 'done', **job.progress()})
+                return
+            if not events:
+                # Keep idle connections alive and report progress
+                yield format_event({'type': 'progress', **job.progress()})
+    
+    mimetype = "text/event-stream" if use_sse else "application/x-ndjson"
+    return current_app.response_class(generate(), mimetype=mimetype, headers={"Cache-Control": "no-cache"})
+
+@api.route("/jobs/<job_id>/resume", methods=["POST"])
+def job_resume(job_id):
+    """Re-run a job for faculty it has not finished, including its retry queue unless retry_failed=0"""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    if job.live and not job.done and job.id in job_store.complete_jobs():
+        # Its roster reader died and no faculty are left, but no worker has noticed yet
+        job = Job.restore(job.id)
+        track_job(job)
+    if not job.done:
+        return jsonify({"error": "Job is still running"}), 409
+    
+    retry_failed = request.args.get('retry_failed', '1').lower() not in ('0', 'false', 'no')
+    queued = resume_job(job, retry_failed)
+    return jsonify({
+        "job_id": job.id,
+        "status": job.status,
+        "queued": queued,
+        "status_url": f"/jobs/{job.id}",
+        "stream_url": f"/jobs/{job.id}/stream"
+    }), 202 if queued else 200
+
+@api.route("/jobs/<job_id>/collaboration")
+def job_collaboration(job_id):
+    """Unique publication counts and co-authorship edges across a job's faculty, so far if still running"""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    
+    df = job_results_frame(job.id)
+    if df is None:
+        df = build_bulk_results_frame([])
+    return jsonify({"job_id": job.id, "status": job.status, **collaboration_summary(df)})
+
+@api.route("/jobs/<job_id>/analytics")
+def job_analytics(job_id):
+    """Per-faculty and job-wide publication aggregates, with an ETag so unchanged dashboards get a 304"""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    
+    response = jsonify(job.analytics())
+    response.add_etag()
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+@api.route("/scheduler")
+def scheduler_status():
+    """Report request scheduler queue depth and wait times"""
+    return jsonify(scheduler.stats())
+
+@api.route("/metrics")
+def metrics_endpoint():
+    """Prometheus scrape endpoint for stage timings, cache, retry and request counters"""
+    lines = [metrics.render()]
+    
+    # Point-in-time gauges from the request scheduler
+    lines.append(f"# HELP {Metrics.PREFIX}scheduler_throttle Divisor applied to the scheduler rate by the circuit breaker\n")
+    lines.append(f"# TYPE {Metrics.PREFIX}scheduler_throttle gauge\n")
+    lines.append(f"{Metrics.PREFIX}scheduler_throttle {scheduler.throttle}\n")
+    lines.append(f"# HELP {Metrics.PREFIX}scheduler_queue_depth Requests waiting for a scheduler token\n")
+    lines.append(f"# TYPE {Metrics.PREFIX}scheduler_queue_depth gauge\n")
+    for priority, depth in scheduler.stats()['queue_depth'].items():
+        lines.append(f'{Metrics.PREFIX}scheduler_queue_depth{{priority="{priority}"}} {depth}\n')
+    
+    return current_app.response_class(''.join(lines), mimetype="text/plain; version=0.0.4")
+
+@api.route("/download")
 def download():
-    global processed_data
+    # Results are looked up by the result id returned with a search, or the job id of an upload.
+    # Profile-only searches download by Scholar author id instead; an author whose
+    # publications aren't cached yet gets 202 until a background fetch has them.
+    result_id = request.args.get('id', '')
+    author_id = parse_scholar_id(request.args.get('author'))
+    processed_data = None
+    if result_id:
+        processed_data = job_results_frame(result_id)
+    elif author_id:
+        try:
+            publications = author_download_publications(author_id)
+        except Exception as e:
+            logger.error(f"Error fetching publications for author {author_id}: {e}")
+            publications = publications_frame(new_publication_columns())
+        if publications is None:
+            return jsonify({"status": "pending", "retry_after": AUTHOR_DOWNLOAD_RETRY_AFTER}), 202, {
+                "Retry-After": str(AUTHOR_DOWNLOAD_RETRY_AFTER)
+            }
+        if not publications.empty:
+            processed_data = sort_publications(publications)
+    
     if processed_data is None or processed_data.empty:
         # Check if this is an API request
         if request.headers.get('Accept', '').find('application/json') != -1:
             return jsonify({"error": "No data available for download"}), 400
         return "No data available for download", 400
 
+    # dedupe=1 exports each work once, with all faculty who list it
+    if request.args.get('dedupe', '').lower() in ('1', 'true', 'yes'):
+        with metrics.span('dataframe_seconds', stage='dedupe'):
+            processed_data = dedupe_publications(processed_data)
+    elif 'Work' in processed_data:
+        processed_data = processed_data.drop(columns='Work')
+
     # Determine format (default to Excel)
-    format_type = request.args.get('format', 'excel') 
-    
-    if format_type == 'json':
-        # Return JSON directly
-        return jsonify(processed_data.to_dict(orient="records"))
-    
-    elif format_type == 'csv':
-        # Return CSV
-        output = BytesIO()
-        processed_data.to_csv(output, index=False)
-        output.seek(0)
-        return send_file(
-            output,
-            as_attachment=True,
-            download_name="faculty_publications.csv",
-            mimetype="text/csv",
-        )
+    format_type = request.args.get('format', 'excel')
+    use_gzip = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+    
+    if format_type in ('json', 'ndjson', 'csv'):
+        # Text formats are streamed chunk by chunk instead of built in memory
+        if format_type == 'csv':
+            chunks = generate_csv(processed_data)
+            mimetype = "text/csv"
+            headers = {"Content-Disposition": "attachment; filename=faculty_publications.csv"}
+        else:
+            chunks = generate_json(processed_data, lines=format_type == 'ndjson')
+            mimetype = "application/x-ndjson" if format_type == 'ndjson' else "application/json"
+            headers = {}
+        
+        if use_gzip:
+            chunks = gzip_stream(chunks)
+            headers["Content-Encoding"] = "gzip"
+        
+        metrics.inc('export_rows_total', len(processed_data), format=format_type)
+        chunks = metrics.timed_iter(chunks, 'export_seconds', format=format_type)
+        
+        return current_app.response_class(chunks, mimetype=mimetype, headers=headers)
     
     else:  # Default to Excel
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-            processed_data.to_excel(writer, index=False, sheet_name="Publications")
-
-        output.seek(0)
-        return send_file(
-            output,
-            as_attachment=True,
-            download_name="faculty_publications.xlsx",
+        # constant_memory mode flushes each row to the temp file as it is written
+        output = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+        output.close()
+        with metrics.span('export_seconds', format='excel'):
+            write_xlsx(processed_data, output.name)
+        metrics.inc('export_rows_total', len(processed_data), format='excel')
+        
+        return current_app.response_class(
+            stream_file_and_remove(output.name),
             mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={
+                "Content-Disposition": "attachment; filename=faculty_publications.xlsx",
+                "Content-Length": str(os.path.getsize(output.name))
+            }
         )
 
+def create_app(config=None):
+    """Build the Flask API front end
+
+    Flask settings come from FLASK_-prefixed environment variables (e.g.
+    FLASK_MAX_CONTENT_LENGTH=104857600), then from config; CORS_ORIGINS may be
+    overridden either way. The fetch engine, caches and job store are shared
+    module state, so several apps in one process share them too.
+    """
+    flask_app = Flask(__name__)
+    flask_app.config['CORS_ORIGINS'] = CORS_ORIGINS
+    flask_app.config.from_prefixed_env()
+    flask_app.config.update(config or {})
+    
+    CORS(flask_app, resources={r"/*": {"origins": flask_app.config['CORS_ORIGINS']}})
+    flask_app.register_blueprint(api)
+    return flask_app
+
+_app_lock = threading.Lock()
+
+def __getattr__(name):
+    """Build the module's `app` on first use, for `gunicorn app:app` and existing imports
+
+    Worker processes and scripts that only use the fetch engine never build it.
+    """
+    global app
+    if name != 'app':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _app_lock:
+        if 'app' not in globals():
+            app = create_app()
+    return app
+
+# Single process: `python app.py`. Scaled out: run the API under gunicorn with
+# JOB_RUNNER=queue and start `JOB_RUNNER=queue python app.py worker` processes
+# against the same JOBS_PATH, CACHE_PATH and RATE_BUDGET_PATH.
 if __name__ == "__main__":
-    app.run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file
+    if sys.argv[1:] == ['worker']:
+        run_worker()
+    else:
+        create_app().run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file
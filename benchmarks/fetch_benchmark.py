@@ -0,0 +1,153 @@
+"""End-to-end scraping benchmark against the local Scholar stand-in.
+
+Starts benchmarks/scholar_standin.py in-process, then runs process_excel_file()
+for each roster size in a fresh interpreter (so caches are cold and peak RSS is
+per roster). Reports faculty/minute, requests per faculty, p50/p99 latency per
+faculty and per request, and peak RSS.
+
+    python benchmarks/fetch_benchmark.py [--rosters 10,100,1000] [--latency 0.05] [--error-rate 0.01]
+
+The scheduler budget defaults to effectively unlimited so that results track
+the fetch engine rather than the politeness delay; pass --rate to measure
+with a real budget.
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, '..'))
+
+from scholar_standin import add_standin_arguments, make_server, standin_options  # noqa: E402
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def build_roster(size):
+    import pandas as pd
+    buffer = io.BytesIO()
+    pd.DataFrame({
+        'Name': [f"Benchmark Author {i}" for i in range(size)],
+        'Institution': [f"Example University {i % 7}" for i in range(size)],
+    }).to_excel(buffer, index=False)
+    buffer.seek(0)
+    return buffer
+
+
+def run_roster(size, rate, burst):
+    """Process one roster in this interpreter and return its measurements"""
+    # Keep the benchmark from touching the on-disk result cache
+    os.environ.setdefault('CACHE_BACKEND', 'memory')
+    os.environ.setdefault('JOBS_PATH', ':memory:')
+    os.environ['SCHEDULER_RATE'] = str(rate)
+    os.environ['SCHEDULER_BURST'] = str(burst)
+    import logging
+    import app
+
+    # Per-request logging would dominate the profile at these rates
+    for name in ('app', 'httpx'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    faculty_latencies = []
+    request_latencies = []
+    process_faculty_async = app.process_faculty_async
+    fetch_url_async = app.fetch_url_async
+
+    async def timed_process_faculty(faculty_info):
+        start = time.perf_counter()
+        try:
+            return await process_faculty_async(faculty_info)
+        finally:
+            faculty_latencies.append(time.perf_counter() - start)
+
+    async def timed_fetch_url(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await fetch_url_async(*args, **kwargs)
+        finally:
+            request_latencies.append(time.perf_counter() - start)
+
+    app.process_faculty_async = timed_process_faculty
+    app.fetch_url_async = timed_fetch_url
+
+    roster = build_roster(size)
+    start = time.perf_counter()
+    results, error = app.process_excel_file(roster)
+    elapsed = time.perf_counter() - start
+    if error:
+        raise RuntimeError(error)
+
+    return {
+        'roster': size,
+        'found': len(results),
+        'elapsed': elapsed,
+        'faculty_p50': percentile(faculty_latencies, 0.5),
+        'faculty_p99': percentile(faculty_latencies, 0.99),
+        'request_p50': percentile(request_latencies, 0.5),
+        'request_p99': percentile(request_latencies, 0.99),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def get_stats(base_url, path='/__stats'):
+    with urllib.request.urlopen(base_url + path) as response:
+        return json.loads(response.read())
+
+
+def run(args):
+    server = make_server(port=0, **standin_options(args))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = 'http://%s:%d' % server.server_address[:2]
+
+    print(f"{'roster':>7} {'found':>6} {'fac/min':>9} {'req/fac':>8} {'fac p50':>8} {'fac p99':>8} "
+          f"{'req p50':>8} {'req p99':>8} {'503s':>6} {'429s':>6} {'rss MB':>7}")
+    for size in args.rosters:
+        get_stats(base_url, '/__reset')
+        env = dict(os.environ, SCHOLAR_BASE_URL=base_url)
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', str(size), '--rate', str(args.rate), '--burst', str(args.burst)],
+            env=env, stdout=subprocess.PIPE, check=True
+        )
+        result = json.loads(child.stdout.decode().strip().splitlines()[-1])
+        requests = get_stats(base_url)
+
+        print(f"{size:>7} {result['found']:>6} {size * 60 / result['elapsed']:>9.1f} "
+              f"{requests['total'] / size:>8.2f} {result['faculty_p50']:>7.2f}s {result['faculty_p99']:>7.2f}s "
+              f"{result['request_p50']:>7.3f}s {result['request_p99']:>7.3f}s "
+              f"{requests['errors']:>6} {requests['rate_limited']:>6} {result['peak_rss_mb']:>7.1f}", flush=True)
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rosters', type=lambda value: [int(size) for size in value.split(',')], default=[10, 100, 1000],
+                        help='comma-separated roster sizes')
+    parser.add_argument('--rate', type=float, default=10000.0, help='scheduler requests/second per host')
+    parser.add_argument('--burst', type=int, default=10000, help='scheduler burst size')
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    add_standin_arguments(parser)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_roster(args.child, args.rate, args.burst)))
+    else:
+        run(args)
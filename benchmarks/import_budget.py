@@ -0,0 +1,90 @@
+"""Import-time budget for the API and worker processes.
+
+Imports app in fresh interpreters and checks that the median import stays
+within the budget and that none of the modules app loads lazily were imported
+on the way. Also reports the time create_app() adds and the slowest imports
+from python -X importtime.
+
+    python benchmarks/import_budget.py [--budget 0.4] [--runs 5] [--top 10]
+
+Exits non-zero when the budget is exceeded or a lazy module was imported.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.join(BENCHMARKS_DIR, '..')
+
+# Modules app.py loads on the code paths that need them - see LazyModule
+LAZY_MODULES = ('pandas', 'numpy', 'bs4', 'lxml', 'openpyxl', 'xlsxwriter', 'pyarrow', 'selectolax.lexbor')
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+app.create_app()
+print(json.dumps({
+    'import': imported,
+    'create_app': time.perf_counter() - start - imported,
+    'lazy_imported': [name for name in %r if name in sys.modules],
+}))
+""" % (LAZY_MODULES,)
+
+
+def child_env():
+    # In-memory stores so the measurement doesn't depend on files left in the working directory
+    return dict(os.environ, CACHE_BACKEND='memory', JOBS_PATH=':memory:', PAGE_CACHE_PATH=':memory:',
+                PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get('PYTHONPATH')])))
+
+
+def measure():
+    child = subprocess.run([sys.executable, '-c', CHILD], env=child_env(), stdout=subprocess.PIPE, check=True)
+    return json.loads(child.stdout.decode().strip().splitlines()[-1])
+
+
+def slowest_imports(top):
+    """(cumulative microseconds, module) of the slowest imports under app, from -X importtime"""
+    child = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], env=child_env(),
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    imports = []
+    for line in child.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), module.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def run(args):
+    runs = [measure() for _ in range(args.runs)]
+    import_time = statistics.median(result['import'] for result in runs)
+    create_app_time = statistics.median(result['create_app'] for result in runs)
+    lazy_imported = sorted({name for result in runs for name in result['lazy_imported']})
+
+    print(f"import app: {import_time:.3f}s median of {args.runs} (budget {args.budget:.3f}s)")
+    print(f"create_app: {create_app_time:.3f}s")
+    print("slowest imports:")
+    for cumulative, module in slowest_imports(args.top):
+        print(f"  {cumulative / 1e6:>7.3f}s  {module}")
+
+    failed = False
+    if import_time > args.budget:
+        print(f"FAIL: import takes {import_time:.3f}s, over the {args.budget:.3f}s budget")
+        failed = True
+    if lazy_imported:
+        print(f"FAIL: lazily loaded modules imported at start-up: {', '.join(lazy_imported)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget', type=float, default=0.4, help='maximum median seconds to import app')
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters to measure')
+    parser.add_argument('--top', type=int, default=10, help='slowest imports to list')
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,70 @@
+"""Micro-benchmark for publication page parsing.
+
+Parses the saved Scholar pages in benchmarks/fixtures with every available
+parser backend and reports rows/second.
+
+    python benchmarks/parse_benchmark.py [--iterations 50]
+"""
+import argparse
+import functools
+import glob
+import os
+import sys
+import time
+
+# Keep the benchmark from touching the on-disk result cache
+os.environ.setdefault('CACHE_BACKEND', 'memory')
+os.environ.setdefault('JOBS_PATH', ':memory:')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import app  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture_pages():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, 'publications_page_*.html'))):
+        with open(path, encoding='utf-8') as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+
+def available_parsers():
+    parsers = dict(app.PUBLICATION_PAGE_PARSERS)
+    # Baseline: BeautifulSoup's pure-Python parser, which the app used before
+    parsers.setdefault('bs4-html.parser', functools.partial(app.parse_publications_page_bs4, parser='html.parser'))
+    return parsers
+
+
+def run(iterations):
+    pages = load_fixture_pages()
+    if not pages:
+        sys.exit(f"No fixture pages found in {FIXTURES_DIR}")
+
+    reference = None
+    print(f"{'parser':<20} {'pages/s':>10} {'rows/s':>12}")
+    for name, parse in available_parsers().items():
+        # Every backend must extract exactly the same rows
+        parsed = [parse(html) for _, html in pages]
+        if reference is None:
+            reference = parsed
+        elif parsed != reference:
+            sys.exit(f"{name} output differs from {next(iter(available_parsers()))}")
+
+        rows = sum(len(publications['Title']) for publications, _ in parsed)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for _, html in pages:
+                parse(html)
+        elapsed = time.perf_counter() - start
+
+        page_count = iterations * len(pages)
+        print(f"{name:<20} {page_count / elapsed:>10.1f} {iterations * rows / elapsed:>12.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=50, help='passes over the fixture pages per parser')
+    args = parser.parse_args()
+    run(args.iterations)
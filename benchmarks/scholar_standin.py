@@ -0,0 +1,188 @@
+"""Local stand-in for Google Scholar, serving the recorded pages in benchmarks/fixtures.
+
+Author searches return search_authors.html with ids derived from the query, so
+every roster name resolves to its own author. Profiles have --pages pages of
+publications: publications_page_full.html for every page but the last, then
+publications_page_last.html. Latency, server errors and rate limiting are
+configurable so the fetch engine can be measured under realistic conditions.
+Pages carry an ETag and conditional requests for an unchanged page get a 304.
+
+    python benchmarks/scholar_standin.py [--port 8001] [--latency 0.2] [--error-rate 0.01]
+
+Point the app at it with SCHOLAR_BASE_URL=http://127.0.0.1:8001. Request counts
+are served as JSON from /__stats.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+FIXTURE_USER_ID = 'AbCdEfGhIjK'  # Author id the publication fixtures were recorded with
+PAGE_SIZE = 100
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def author_ids_for(query, count=3):
+    """Stable, distinct Scholar-style author ids for a search query"""
+    digest = hashlib.sha1(query.lower().encode('utf-8')).hexdigest()
+    return [f"SI{digest[:9]}{i}" for i in range(count)]
+
+
+class StandinState:
+    """Configuration and request counters shared by all handler threads"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit_rate=0.0, retry_after=1, pages=3):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.pages = pages
+        self.search_html = load_fixture('search_authors.html')
+        self.full_page_html = load_fixture('publications_page_full.html')
+        self.last_page_html = load_fixture('publications_page_last.html')
+        self._lock = threading.Lock()
+        self.counts = {'search': 0, 'profile': 0, 'not_modified': 0, 'errors': 0, 'rate_limited': 0, 'other': 0}
+
+    def count(self, kind):
+        with self._lock:
+            self.counts[kind] += 1
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self.counts)
+        # not_modified responses are also counted as searches or profiles
+        counts['total'] = sum(count for kind, count in counts.items() if kind != 'not_modified')
+        return counts
+
+    def reset(self):
+        with self._lock:
+            for kind in self.counts:
+                self.counts[kind] = 0
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = None  # Set by make_server()
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output readable
+
+    def send_body(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        state = self.state
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/__stats':
+            return self.send_body(200, json.dumps(state.stats()), 'application/json')
+        if url.path == '/__reset':
+            state.reset()
+            return self.send_body(200, '{}', 'application/json')
+        if url.path != '/citations':
+            state.count('other')
+            return self.send_body(404, 'Not found')
+
+        delay = state.latency + random.uniform(0, state.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        roll = random.random()
+        if roll < state.rate_limit_rate:
+            state.count('rate_limited')
+            return self.send_body(429, 'Too many requests', headers={'Retry-After': str(state.retry_after)})
+        if roll < state.rate_limit_rate + state.error_rate:
+            state.count('errors')
+            return self.send_body(503, 'Service unavailable')
+
+        if query.get('view_op') == ['search_authors']:
+            state.count('search')
+            html = state.search_html
+            for i, author_id in enumerate(author_ids_for(query.get('mauthors', [''])[0])):
+                html = html.replace(f'__USER_{i}__', author_id)
+            return self.send_page(html)
+
+        user = query.get('user', [''])[0]
+        if not user:
+            state.count('other')
+            return self.send_body(404, 'Not found')
+
+        state.count('profile')
+        page = int(query.get('cstart', ['0'])[0]) // PAGE_SIZE
+        html = state.last_page_html if page >= state.pages - 1 else state.full_page_html
+        return self.send_page(html.replace(FIXTURE_USER_ID, user))
+
+    def send_page(self, html):
+        etag = '"%s"' % hashlib.sha1(html.encode('utf-8')).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.state.count('not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        return self.send_body(200, html, headers={'ETag': etag})
+
+
+def make_server(host='127.0.0.1', port=0, **options):
+    """Create a stand-in server; port 0 picks a free port (see server.server_address)"""
+    handler = type('Handler', (StandinHandler,), {'state': StandinState(**options)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def add_standin_arguments(parser):
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.05, help='extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429 responses')
+    parser.add_argument('--pages', type=int, default=3, help='publication pages per author')
+
+
+def standin_options(args):
+    return {
+        'latency': args.latency,
+        'jitter': args.jitter,
+        'error_rate': args.error_rate,
+        'rate_limit_rate': args.rate_limit_rate,
+        'retry_after': args.retry_after,
+        'pages': args.pages,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    add_standin_arguments(parser)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, **standin_options(args))
+    host, port = server.server_address[:2]
+    print(f"Scholar stand-in listening on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        sys.exit(0)
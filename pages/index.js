@@ -3,11 +3,17 @@ import axios from 'axios';
 import styles from '../styles/styles.module.css';
 import Image from 'next/image';
 
+const JOB_POLL_INTERVAL = 2000; // ms between bulk upload progress checks
+
 export default function Home() {
   const [isLoading, setIsLoading] = useState(false);
+  const [uploadProgress, setUploadProgress] = useState(null);
   const [error, setError] = useState(null);
   const [singleAuthorResult, setSingleAuthorResult] = useState(null);
   const [bulkResults, setBulkResults] = useState(null);
+  const [singlePublicationsPage, setSinglePublicationsPage] = useState(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [bulkResultId, setBulkResultId] = useState(null);
   const [activeAuthorTab, setActiveAuthorTab] = useState(0);
   const [activeTab, setActiveTab] = useState(singleAuthorResult ? 0 : 1); // Default to the tab that has data
 
@@ -27,9 +33,11 @@ export default function Home() {
     }
 
     try {
+      // Profile-only mode returns the author card without waiting for publications
       const response = await axios.post('http://localhost:5000/', {
         name: name,
-        institution: institution || ''
+        institution: institution || '',
+        mode: 'profile'
       }, {
         headers: {
           'Content-Type': 'application/json',
@@ -37,14 +45,18 @@ export default function Home() {
         }
       });
 
-      // Backend returns JSON directly
       setSingleAuthorResult({
         profile: response.data.profile,
-        results: response.data.results
+        results: [],
+        hasMore: true
       });
+      setSinglePublicationsPage(null);
       
       setBulkResults(null);
       setActiveTab(0);
+      setIsLoading(false);
+
+      await loadPublicationsPage(response.data.profile.id, 0);
     } catch (err) {
       console.error('Error searching for author:', err);
       setError(err.response?.data?.error || 
@@ -53,6 +65,31 @@ export default function Home() {
       setIsLoading(false);
     }
   };
+
+  // Load one page of the single author's publications, appending it to the table
+  const loadPublicationsPage = async (authorId, page) => {
+    setIsLoadingMore(true);
+    try {
+      const response = await axios.get(`http://localhost:5000/authors/${authorId}/publications?page=${page}`, {
+        headers: {
+          'Accept': 'application/json'
+        }
+      });
+
+      setSingleAuthorResult((current) => current && current.profile.id === authorId ? {
+        ...current,
+        results: [...current.results, ...response.data.publications],
+        hasMore: response.data.has_more
+      } : current);
+      setSinglePublicationsPage(page);
+    } catch (err) {
+      console.error('Error loading publications:', err);
+      setError(err.response?.data?.error || 
+               'An error occurred while loading publications. Please try again.');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
   
   // Handle file upload
   const handleFileUpload = async (event) => {
@@ -73,19 +110,47 @@ export default function Home() {
     formData.append('file', file);
     
     try {
+      // The backend queues the upload as a job and returns its id right away
       const response = await axios.post('http://localhost:5000/', formData, {
         headers: {
           'Accept': 'application/json'
         }
       });
 
-      // Process the JSON response
-      if (response.data.faculty_results && response.data.faculty_results.length > 0) {
-        setBulkResults(response.data.faculty_results);
-        setSingleAuthorResult(null);
-        setActiveTab(1);
-        setActiveAuthorTab(0);
-      } else {
+      const jobId = response.data.job_id;
+      let results = [];
+      let job;
+      setUploadProgress({ completed: 0, total: response.data.total });
+
+      // Poll for progress, showing faculty as soon as they finish
+      do {
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL));
+        const jobResponse = await axios.get(`http://localhost:5000/jobs/${jobId}?since=${results.length}`, {
+          headers: {
+            'Accept': 'application/json'
+          }
+        });
+        job = jobResponse.data;
+        setUploadProgress({ completed: job.completed, total: job.total });
+
+        if (job.results.length > 0) {
+          if (results.length === 0) {
+            setSingleAuthorResult(null);
+            setBulkResultId(null);
+            setActiveTab(1);
+            setActiveAuthorTab(0);
+          }
+          results = [...results, ...job.results];
+          setBulkResults(results);
+        }
+      } while (job.status === 'queued' || job.status === 'running');
+
+      // Downloads are keyed by the job id once the job has finished
+      setBulkResultId(jobId);
+
+      if (job.status === 'failed') {
+        setError(job.error || 'An error occurred while processing the file. Please try again.');
+      } else if (results.length === 0) {
         setError('No results found in the uploaded file.');
       }
     } catch (err) {
@@ -94,23 +159,54 @@ export default function Home() {
                'An error occurred while processing the file. Please try again.');
     } finally {
       setIsLoading(false);
+      setUploadProgress(null);
     }
   };
   
   // Handle download
-  const handleDownload = async (format = 'excel') => {
+  // `query` is either `id=<result id>` or `author=<Scholar author id>`
+  const handleDownload = async (query, format = 'excel') => {
+    const url = `http://localhost:5000/download?${query}&format=${format}`;
     try {
-      window.open(`http://localhost:5000/download?format=${format}`, '_blank');
+      if (query.startsWith('author=')) {
+        await downloadAuthorFile(url, format);
+      } else {
+        window.open(url, '_blank');
+      }
     } catch (err) {
       console.error('Error downloading file:', err);
       setError('An error occurred while downloading the file.');
     }
   };
+
+  // Author downloads answer 202 while the author's publications are fetched in the
+  // background, so ask again until the file is ready, then save it
+  const downloadAuthorFile = async (url, format) => {
+    let response;
+    do {
+      response = await axios.get(url, {
+        responseType: 'blob',
+        validateStatus: (status) => status === 200 || status === 202
+      });
+      if (response.status === 202) {
+        const pending = JSON.parse(await response.data.text());
+        await new Promise((resolve) => setTimeout(resolve, pending.retry_after * 1000));
+      }
+    } while (response.status === 202);
+
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(response.data);
+    link.download = `faculty_publications.${format === 'excel' ? 'xlsx' : format}`;
+    link.click();
+    URL.revokeObjectURL(link.href);
+  };
   
   // Reset search results
   const handleNewSearch = () => {
     setSingleAuthorResult(null);
     setBulkResults(null);
+    setSinglePublicationsPage(null);
+    setBulkResultId(null);
   };
   
   return (
@@ -164,7 +260,7 @@ export default function Home() {
                   <input 
                     type="file" 
                     name="file" 
-                    accept=".xlsx,.xls" 
+                    accept=".xlsx,.xls,.csv,.ndjson,.jsonl" 
                     disabled={isLoading}
                   />
                 </div>
@@ -174,7 +270,9 @@ export default function Home() {
                 className={styles.button}
                 disabled={isLoading}
               >
-                {isLoading ? 'Uploading...' : 'Upload'}
+                {uploadProgress
+                  ? `Processing ${uploadProgress.completed}/${uploadProgress.total}...`
+                  : isLoading ? 'Uploading...' : 'Upload'}
               </button>
             </form>
           </div>
@@ -240,7 +338,7 @@ export default function Home() {
                       </tr>
                     </thead>
                     <tbody>
-                      {singleAuthorResult.results.length > 0 ? (
+                      {singleAuthorResult.results.length > 0 || isLoadingMore ? (
                         singleAuthorResult.results.map((pub, index) => (
                           <tr key={index}>
                             <td>{pub.Title}</td>
@@ -256,10 +354,19 @@ export default function Home() {
                       )}
                     </tbody>
                   </table>
+                  {(isLoadingMore || singleAuthorResult.hasMore) && (
+                    <button
+                      onClick={() => loadPublicationsPage(singleAuthorResult.profile.id, singlePublicationsPage + 1)}
+                      className={`${styles.button} ${styles.buttonSecondary}`}
+                      disabled={isLoadingMore || singlePublicationsPage === null}
+                    >
+                      {isLoadingMore ? 'Loading...' : 'Load more'}
+                    </button>
+                  )}
                 </div>
                 
                 <div className={styles.actionButtons}>
-                  <button onClick={() => handleDownload('excel')} className={styles.button}>
+                  <button onClick={() => handleDownload(`author=${singleAuthorResult.profile.id}`, 'excel')} className={styles.button}>
                     Download
                   </button>
                   <button onClick={handleNewSearch} className={`${styles.button} ${styles.buttonSecondary}`}>
@@ -340,7 +447,7 @@ export default function Home() {
                   </div>
                   
                   <div className={styles.actionButtons}>
-                    <button onClick={() => handleDownload('excel')} className={styles.button}>
+                    <button onClick={() => handleDownload(`id=${bulkResultId}`, 'excel')} className={styles.button} disabled={!bulkResultId}>
                       Download All
                     </button>
                     <button onClick={handleNewSearch} className={`${styles.button} ${styles.buttonSecondary}`}>
@@ -23,14 +23,54 @@ export const searchSingleAuthor = async (name, institution) => {
   }
 };
 
+// Returns { profile, publications_url } without waiting for the author's publications
+export const searchAuthorProfile = async (name, institution) => {
+  try {
+    const response = await axios.post(`${API_URL}/`, {
+      name,
+      institution: institution || '',
+      mode: 'profile',
+    }, {
+      headers: {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+      },
+    });
+    
+    return response.data;
+  } catch (error) {
+    console.error('Error searching for author:', error.message, error.response);
+    throw error;
+  }
+};
+
+// Returns one page of publications, newest first: { author_id, page, publications, has_more }
+export const getAuthorPublications = async (authorId, page = 0) => {
+  try {
+    const response = await axios.get(`${API_URL}/authors/${authorId}/publications`, {
+      params: { page },
+      headers: {
+        'Accept': 'application/json',
+      },
+    });
+    
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching publications:', error);
+    throw error;
+  }
+};
+
 export const uploadFile = async (file) => {
   try {
     const formData = new FormData();
     formData.append('file', file);
     
+    // Returns the background job: { job_id, status, total, status_url, stream_url }
     const response = await axios.post(`${API_URL}/`, formData, {
       headers: {
         'Content-Type': 'multipart/form-data',
+        'Accept': 'application/json',
       },
     });
     
@@ -41,9 +81,51 @@ export const uploadFile = async (file) => {
   }
 };
 
-export const downloadFile = async () => {
+export const getJob = async (jobId, since = 0) => {
+  try {
+    const response = await axios.get(`${API_URL}/jobs/${jobId}`, {
+      params: { since },
+      headers: {
+        'Accept': 'application/json',
+      },
+    });
+    
+    return response.data;
+  } catch (error) {
+    console.error('Error fetching job status:', error);
+    throw error;
+  }
+};
+
+// Re-runs a finished or interrupted job for its unfinished faculty and retry queue
+export const resumeJob = async (jobId, retryFailed = true) => {
+  try {
+    const response = await axios.post(`${API_URL}/jobs/${jobId}/resume`, null, {
+      params: { retry_failed: retryFailed ? 1 : 0 },
+      headers: {
+        'Accept': 'application/json',
+      },
+    });
+    
+    return response.data;
+  } catch (error) {
+    console.error('Error resuming job:', error);
+    throw error;
+  }
+};
+
+export const downloadFile = async (resultId, format = 'excel') => {
+  try {
+    window.open(`${API_URL}/download?id=${resultId}&format=${format}`, '_blank');
+  } catch (error) {
+    console.error('Error downloading file:', error);
+    throw error;
+  }
+};
+
+export const downloadAuthorPublications = async (authorId, format = 'excel') => {
   try {
-    window.open(`${API_URL}/download`, '_blank');
+    window.open(`${API_URL}/download?author=${authorId}&format=${format}`, '_blank');
   } catch (error) {
     console.error('Error downloading file:', error);
     throw error;